@@ -5,6 +5,7 @@ Main entry point for Genesys Learning Content Extractor
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # Add src directory to Python path
@@ -13,20 +14,55 @@ sys.path.insert(0, str(src_path))
 
 from universal_genesys_extractor import UniversalGenesysExtractor
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Genesys Learning Content Extractor")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Number of parallel Chrome workers (overrides global_settings.worker_count)")
+    parser.add_argument('--tabs', type=int, default=None,
+                        help="Tabs loading concurrently in each Chrome worker (overrides global_settings.tabs_per_driver)")
+    parser.add_argument('--shards', type=int, default=None,
+                        help="Number of worker processes, each with its own browser (overrides global_settings.shard_count)")
+    parser.add_argument('--queue', choices=['enqueue', 'work', 'collect'], default=None,
+                        help="Shared work-queue mode: enqueue the course lists, run a worker, or collect results")
+    parser.add_argument('--queue-db', default=None,
+                        help="Work queue database (overrides global_settings.work_queue.db_path)")
+    parser.add_argument('--run-id', default=None,
+                        help="Work queue run identifier (overrides global_settings.work_queue.run_id)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip courses already extracted by an interrupted run (from its checkpoint or output)")
+    parser.add_argument('--validate-urls', action='store_true',
+                        help="Only check that the generated course URLs resolve, then exit")
+    return parser.parse_args()
+
 def main():
     """Main execution function"""
+    args = parse_args()
+
     print("=== Genesys Learning Content Extractor v2.1.0 ===")
     print("Universal extraction system with organized structure")
 
     # Initialize extractor with config from root directory
     config_path = Path(__file__).parent / "config.json"
-    extractor = UniversalGenesysExtractor(str(config_path))
+    extractor = UniversalGenesysExtractor(str(config_path), worker_count=args.workers,
+                                          shard_count=args.shards, tab_count=args.tabs)
 
     # For now, just extract e-learning (existing data)
     # In the future, add 'webinars', 'self-study' when lists are provided
     content_types = ['e-learning']
 
-    results = extractor.run_extraction(content_types)
+    if args.validate_urls:
+        return {ct: extractor.validate_course_urls(ct) for ct in content_types}
+
+    if args.queue:
+        work_queue = extractor.open_work_queue(args.queue_db, args.run_id)
+        if args.queue == 'enqueue':
+            return extractor.enqueue_content_types(work_queue, content_types)
+        if args.queue == 'work':
+            return extractor.run_queue_worker(work_queue, content_types)
+        return extractor.collect_from_queue(work_queue)
+
+    results = extractor.run_extraction(content_types, resume=args.resume)
 
     print(f"\n🎉 Extraction complete!")
     print(f"Check data/output/current/ for results")
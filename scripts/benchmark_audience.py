@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Worst-case target-audience benchmark
+
+Times audience extraction on large synthetic pages that contain audience
+headings but no match, where the old lazy DOTALL header regexes backtrack
+over the rest of the page once per heading. Page sizes double each step, so
+linear time shows as a roughly doubling time column.
+
+    python scripts/benchmark_audience.py --sizes 50 100 200 400
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from universal_genesys_extractor import UniversalGenesysExtractor
+
+# The header patterns extraction used before page segmentation, for comparison
+LEGACY_HEADER_PATTERNS = [
+    r'Target\s+Audience[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'Intended\s+Audience[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'Who\s+Should\s+Attend[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'This\s+(?:course|eLearning)\s+is\s+(?:for|intended\s+for)[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'Designed\s+for[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'Suitable\s+for[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
+    r'Target\s+Audience[:\s]*([^\.]+?)(?:Overview|Introduction)',
+    r'Intended\s+Audience[:\s]*([^\.]+?)(?:Overview|Introduction)'
+]
+
+# Heading followed by sentence-free filler: every legacy pattern scans to the end of the page
+FILLER = "Target Audience the platform routes interactions across queues and flows "
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark audience extraction on pages with no match")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 50, 100, 200],
+                        help="Page sizes in KB")
+    parser.add_argument('--config', default=str(Path(__file__).parent.parent / "config.json"))
+    parser.add_argument('--skip-legacy', action='store_true', help="Only time the current matcher")
+    return parser.parse_args()
+
+
+def legacy_audience(extractor, page_text):
+    """Audience extraction as done by the old header regexes"""
+    for pattern in LEGACY_HEADER_PATTERNS:
+        for match in re.finditer(pattern, page_text, re.IGNORECASE | re.DOTALL):
+            detected = extractor.detect_audiences_in_text(match.group(1).strip())
+            if detected:
+                return detected
+    return []
+
+
+def time_call(func, *args):
+    """Seconds taken by one call"""
+    start_time = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+    extractor = UniversalGenesysExtractor(args.config)
+
+    print("=== Target Audience Worst-Case Benchmark ===")
+    print(f"{'size':>8} {'current':>10} {'legacy':>10}")
+    for size_kb in args.sizes:
+        page_text = (FILLER * (size_kb * 1024 // len(FILLER) + 1))[:size_kb * 1024]
+
+        current = time_call(extractor.extract_target_audience_enhanced, page_text)
+        legacy = 'skipped' if args.skip_legacy else f"{time_call(legacy_audience, extractor, page_text):.3f}s"
+        print(f"{size_kb:>6}KB {current:>9.3f}s {legacy:>10}")
+
+
+if __name__ == "__main__":
+    main()
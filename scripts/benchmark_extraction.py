@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Offline extraction benchmark
+
+Runs the parsing/extraction pipeline against recorded snapshots or synthetic
+pages, with no browser or network, and reports pages per second.
+
+    python scripts/benchmark_extraction.py --fake 2000
+    python scripts/benchmark_extraction.py --snapshots data/snapshots --profile
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import pstats
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from universal_genesys_extractor import UniversalGenesysExtractor
+from utils.fetchers import FakeFetcher, RecordedFetcher
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark offline extraction throughput")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshots', help="Directory of pages recorded with record_snapshots_dir")
+    source.add_argument('--fake', type=int, metavar='N', help="Number of synthetic pages to generate")
+    parser.add_argument('--content-type', default='e-learning')
+    parser.add_argument('--config', default=str(Path(__file__).parent.parent / "config.json"))
+    parser.add_argument('--repeat', type=int, default=1, help="Passes over the page set")
+    parser.add_argument('--profile', action='store_true', help="Print the top cProfile entries")
+    return parser.parse_args()
+
+
+def run_benchmark(extractor, content_type, fetcher, urls, repeat=1):
+    """Extract every URL repeat times, returning (pages, seconds)"""
+    courses = [{'title': url.rstrip('/').rsplit('/', 1)[-1], 'url': url} for url in urls]
+
+    start_time = time.perf_counter()
+    # Per-page progress output would dominate the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            for course_data in courses:
+                extractor.extract_with_fetcher(content_type, course_data, fetcher)
+    return len(courses) * repeat, time.perf_counter() - start_time
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+    extractor = UniversalGenesysExtractor(args.config)
+    extractor.snapshot_dir = None
+
+    if args.snapshots:
+        fetcher = RecordedFetcher(args.snapshots)
+        urls = fetcher.urls()
+    else:
+        fetcher = FakeFetcher()
+        url_base = extractor.config['course_types'][args.content_type]['url_base']
+        urls = [f"{url_base}benchmark-course-{i}" for i in range(args.fake)]
+
+    if not urls:
+        print("No pages to benchmark")
+        return
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+
+    pages, seconds = run_benchmark(extractor, args.content_type, fetcher, urls, args.repeat)
+
+    if profiler:
+        profiler.disable()
+
+    print(f"=== Extraction Benchmark ({fetcher.backend}) ===")
+    print(f"Pages: {pages}")
+    print(f"Time: {seconds:.2f}s")
+    print(f"Throughput: {pages / seconds:.1f} pages/s")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
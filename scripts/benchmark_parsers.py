@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+HTML parser backend benchmark
+
+Extracts the same pages with every installed parser backend, reports pages
+per second against html.parser and checks that each backend produces the
+same fields.
+
+    python scripts/benchmark_parsers.py --snapshots data/snapshots
+    python scripts/benchmark_parsers.py --fake 1000
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from universal_genesys_extractor import UniversalGenesysExtractor
+from utils.fetchers import FakeFetcher, RecordedFetcher
+from utils.html_parsing import available_backends
+
+# Fields that legitimately differ between two extractions of the same page
+VOLATILE_FIELDS = ('extraction_timestamp',)
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on the same pages")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshots', help="Directory of pages recorded with record_snapshots_dir")
+    source.add_argument('--fake', type=int, metavar='N', help="Number of synthetic pages to generate")
+    parser.add_argument('--content-type', default='e-learning')
+    parser.add_argument('--config', default=str(Path(__file__).parent.parent / "config.json"))
+    parser.add_argument('--repeat', type=int, default=3, help="Passes over the page set per backend")
+    return parser.parse_args()
+
+
+def extract_all(extractor, content_type, pages, repeat):
+    """Extract every page repeat times, returning (field dicts, seconds)"""
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            results = [extractor.extract_from_page_source(content_type, course_data, page_source)
+                       for course_data, page_source in pages]
+    seconds = time.perf_counter() - start_time
+
+    records = []
+    for content in results:
+        record = content.to_dict()
+        for field in VOLATILE_FIELDS:
+            record.pop(field, None)
+        records.append(record)
+    return records, seconds
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+    extractor = UniversalGenesysExtractor(args.config)
+
+    if args.snapshots:
+        fetcher = RecordedFetcher(args.snapshots)
+        urls = fetcher.urls()
+    else:
+        fetcher = FakeFetcher()
+        url_base = extractor.config['course_types'][args.content_type]['url_base']
+        urls = [f"{url_base}benchmark-course-{i}" for i in range(args.fake)]
+
+    if not urls:
+        print("No pages to benchmark")
+        return
+
+    # Pages are loaded once so only parsing and extraction are timed
+    pages = [({'title': url.rstrip('/').rsplit('/', 1)[-1], 'url': url}, fetcher.fetch(url).page_source)
+             for url in urls]
+
+    print(f"=== Parser Benchmark ({fetcher.backend}, {len(pages)} pages x {args.repeat}) ===")
+    baseline = None
+    for backend in available_backends():
+        extractor.parser_backend = backend
+        records, seconds = extract_all(extractor, args.content_type, pages, args.repeat)
+        throughput = len(pages) * args.repeat / seconds
+
+        if baseline is None:
+            baseline = (records, throughput)
+            print(f"{backend:12} {throughput:8.1f} pages/s   (baseline)")
+            continue
+
+        mismatches = [record['url'] for record, expected in zip(records, baseline[0]) if record != expected]
+        print(f"{backend:12} {throughput:8.1f} pages/s   {throughput / baseline[1]:.2f}x   "
+              f"{len(mismatches)} pages differ")
+        for url in mismatches[:5]:
+            print(f"    differs: {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ Configurable extraction system for e-learning, webinars, and self-study material
 """
 
 import json
-import csv
 import time
 import re
 from datetime import datetime
@@ -13,10 +12,89 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-from dataclasses import dataclass
+from selenium.common.exceptions import WebDriverException
+from dataclasses import dataclass, asdict, fields
 from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
 import os
+import queue
+import threading
+import requests
+
+from utils.driver_pool import DriverPool
+from utils.fetchers import HttpFetcher, SeleniumFetcher, RecordedFetcher, FetchResult
+from utils.async_fetcher import AsyncFetcher
+from utils.sharded_runner import leftover_shard_records, run_shards
+from utils.tab_scheduler import TabScheduler
+from utils.work_queue import SqliteWorkQueue, Heartbeat, default_worker_id
+from utils.concurrency import AimdController
+from utils.retry_scheduler import RetryScheduler
+from utils.parse_pool import ParsePool
+from utils.html_parsing import parse_html, resolve_backend
+from utils.in_page_extraction import InPageDocument, collect_page_fields
+from utils.page_sections import segment_page
+from utils.audience_matcher import AudienceMatcher, taxonomy_from_terms
+from utils.duration import parse_duration
+from utils.checkpoint import CheckpointLog, CheckpointResults, load_checkpoint
+from utils.result_store import SqliteResultStore
+from utils.parquet_export import parquet_available
+from utils.dataset_writer import CombinedDatasetWriter, DatasetWriter, item_record
+from utils.page_readiness import collect_selectors
+from utils.api_capture import enable_performance_logging, find_course_record, fields_from_record
+
+# Comprehensive standardized audience types from production extraction
+# (default for global_settings.audience_taxonomy)
+AUDIENCE_TYPES = {
+    'developer': 'Developers',
+    'developers': 'Developers',
+    'system administrator': 'System Administrators',
+    'system administrators': 'System Administrators',
+    'administrator': 'Administrators',
+    'administrators': 'Administrators',
+    'admin': 'Administrators',
+    'admins': 'Administrators',
+    'supervisor': 'Supervisors',
+    'supervisors': 'Supervisors',
+    'manager': 'Managers',
+    'managers': 'Managers',
+    'agent': 'Agents',
+    'agents': 'Agents',
+    'contact center agent': 'Agents',
+    'contact center agents': 'Agents',
+    'business user': 'Business Users',
+    'business users': 'Business Users',
+    'analyst': 'Analysts',
+    'analysts': 'Analysts',
+    'contact center manager': 'Contact Center Managers',
+    'contact center managers': 'Contact Center Managers',
+    'contact center administrator': 'System Administrators',
+    'contact center administrators': 'System Administrators',
+    'quality manager': 'Managers',
+    'quality managers': 'Managers',
+    'workforce manager': 'Managers',
+    'workforce managers': 'Managers',
+    'it professional': 'IT Professionals',
+    'it professionals': 'IT Professionals',
+    'IT': 'IT Professionals'
+}
+
+# Characters after an audience heading searched for audience terms
+AUDIENCE_WINDOW = 400
+
+# Extraction statuses that send a course back for another attempt
+RETRYABLE_STATUSES = ('error', 'blocked')
+
+# HTTP statuses that mean the site is throttling or challenging us
+BLOCK_STATUSES = (403, 429, 503)
+
+# URL patterns blocked for each browser_settings.blocked_resource_types entry
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg', '*.ts'],
+    'stylesheet': ['*.css']
+}
 
 @dataclass
 class LearningContent:
@@ -27,10 +105,14 @@ class LearningContent:
     description: str = ""
     learning_type: str = ""
     duration: str = ""
+    duration_minutes: Optional[int] = None
     course_outline: List[str] = None
     target_audience: List[str] = None
     extraction_timestamp: str = ""
     page_length: int = 0
+    time_to_ready: float = 0.0
+    extraction_status: str = ""  # ok, error, blocked
+    block_marker: str = ""  # block_markers entry seen in the page text (adaptive concurrency only)
 
     def __post_init__(self):
         if self.course_outline is None:
@@ -38,13 +120,37 @@ class LearningContent:
         if self.target_audience is None:
             self.target_audience = []
 
+    def to_dict(self):
+        """Plain dict of every field"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild content from a dict, ignoring unknown keys"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
 class UniversalGenesysExtractor:
     """Universal extractor for different types of Genesys learning content"""
 
-    def __init__(self, config_file="config.json"):
+    def __init__(self, config_file="config.json", worker_count=None, shard_count=None, tab_count=None):
         """Initialize with configuration file"""
+        self.config_file = config_file
         self.config = self.load_config(config_file)
         self.driver = None
+        self.driver_pool = None
+        self.http_fetcher = None
+        self.parse_pool = None
+        self.parse_pool_lock = threading.Lock()
+        self.result_store = None
+        self.worker_count = worker_count
+        self.shard_count = shard_count
+        self.tab_count = tab_count
+        self.snapshot_dir = (self.config or {}).get('global_settings', {}).get('record_snapshots_dir')
+        self.parser_backend = resolve_backend((self.config or {}).get('global_settings', {}).get('html_parser', 'html.parser'))
+        self.audience_matcher = AudienceMatcher(
+            (self.config or {}).get('global_settings', {}).get('audience_taxonomy') or taxonomy_from_terms(AUDIENCE_TYPES)
+        )
         self.results = []
 
     def load_config(self, config_file):
@@ -58,6 +164,11 @@ class UniversalGenesysExtractor:
 
     def setup_driver(self):
         """Setup Chrome driver with configured options"""
+        self.driver = self.create_driver()
+        return self.driver is not None
+
+    def create_driver(self):
+        """Create a new Chrome driver with configured options"""
         chrome_options = Options()
         browser_settings = self.config.get('global_settings', {}).get('browser_settings', {})
 
@@ -76,16 +187,188 @@ class UniversalGenesysExtractor:
         window_size = browser_settings.get('window_size', '1920,1080')
         chrome_options.add_argument(f'--window-size={window_size}')
 
+        # Tabs start loading without blocking; readiness is polled per tab instead
+        if self.get_tab_count() > 1:
+            chrome_options.page_load_strategy = 'none'
+
+        # Performance logging is needed to read API responses in api_capture mode
+        if any(
+            type_config.get('extraction_settings', {}).get('extraction_mode') == 'api_capture'
+            for type_config in self.config.get('course_types', {}).values()
+        ):
+            enable_performance_logging(chrome_options)
+
+        # Images are also disabled at the content-settings level when blocked
+        if 'image' in browser_settings.get('blocked_resource_types', []):
+            chrome_options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2}
+            )
+
         driver_path = self.config.get('global_settings', {}).get('chrome_driver_path', './chromedriver.exe')
 
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.set_page_load_timeout(self.get_page_load_timeout())
+            self.install_request_blocking(driver)
             print(f"Chrome driver setup successful!")
-            return True
+            return driver
         except Exception as e:
             print(f"Chrome driver setup failed: {e}")
+            return None
+
+    def get_page_load_timeout(self):
+        """Longest wait_time of any content type, so a hung load cannot block get() for Chrome's 300s"""
+        wait_times = [
+            type_config.get('extraction_settings', {}).get('wait_time', 10)
+            for type_config in self.config.get('course_types', {}).values()
+        ]
+        return max(wait_times or [10])
+
+    def get_blocked_url_patterns(self):
+        """Build the CDP blocklist from configured resource types and URL patterns"""
+        browser_settings = self.config.get('global_settings', {}).get('browser_settings', {})
+
+        patterns = []
+        for resource_type in browser_settings.get('blocked_resource_types', []):
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        patterns.extend(browser_settings.get('blocked_url_patterns', []))
+
+        return list(dict.fromkeys(patterns))
+
+    def install_request_blocking(self, driver):
+        """Block unneeded requests through Chrome DevTools Protocol"""
+        patterns = self.get_blocked_url_patterns()
+        if not patterns:
+            return
+
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            print(f"Request blocking enabled ({len(patterns)} URL patterns)")
+        except Exception as e:
+            print(f"Request blocking not available: {e}")
+
+    def get_worker_count(self):
+        """Number of parallel Chrome workers (CLI override, then config)"""
+        if self.worker_count:
+            return max(1, int(self.worker_count))
+        return max(1, int(self.config.get('global_settings', {}).get('worker_count', 1)))
+
+    def get_tab_count(self):
+        """Number of tabs loading concurrently in each driver (CLI override, then config)"""
+        if self.tab_count:
+            return max(1, int(self.tab_count))
+        return max(1, int(self.config.get('global_settings', {}).get('tabs_per_driver', 1)))
+
+    def setup_driver_pool(self, warm=True):
+        """Create the driver pool and make sure at least one driver starts"""
+        if self.driver_pool:
+            return True
+
+        recycling = self.config.get('global_settings', {}).get('driver_recycling', {})
+        self.driver_pool = DriverPool(
+            self.create_driver,
+            self.get_worker_count(),
+            max_pages=recycling.get('max_pages'),
+            max_rss_mb=recycling.get('max_rss_mb'),
+            recycle_on_error=recycling.get('recycle_on_error', True)
+        )
+        if not warm:
+            return True
+
+        try:
+            with self.driver_pool.lease():
+                pass
+            return True
+        except RuntimeError:
+            self.driver_pool = None
             return False
 
+    def close_drivers(self):
+        """Quit the pooled drivers and the standalone driver, if any"""
+        closed = 0
+        if self.driver_pool:
+            closed += self.driver_pool.close()
+            self.driver_pool = None
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            closed += 1
+        return closed
+
+    def get_parse_pool(self):
+        """Shared parse process pool, or None when global_settings.parse_pool.workers is 0"""
+        with self.parse_pool_lock:
+            if not self.parse_pool:
+                workers = self.config.get('global_settings', {}).get('parse_pool', {}).get('workers', 0)
+                if workers:
+                    self.parse_pool = ParsePool(self.config_file, workers)
+                    print(f"Parsing pages in {self.parse_pool.workers} worker processes")
+            return self.parse_pool
+
+    def close_parse_pool(self):
+        """Stop the parse worker processes, if any"""
+        if self.parse_pool:
+            self.parse_pool.close()
+            self.parse_pool = None
+
+    def get_result_store(self):
+        """SQLite result store from global_settings.result_store, or None when it is disabled"""
+        store_settings = self.config.get('global_settings', {}).get('result_store', {})
+        if not store_settings.get('enabled', False):
+            return None
+
+        if self.result_store is None:
+            self.result_store = SqliteResultStore(
+                store_settings.get('db_path', 'data/output/results.db'),
+                batch_size=store_settings.get('batch_size', 500)
+            )
+        return self.result_store
+
+    def close_result_store(self):
+        """Close the result store if one is open"""
+        if self.result_store:
+            self.result_store.close()
+            self.result_store = None
+
+    def get_http_fetcher(self):
+        """Shared HTTP fetcher built from global_settings.http_settings"""
+        if not self.http_fetcher:
+            http_settings = self.config.get('global_settings', {}).get('http_settings', {})
+            self.http_fetcher = HttpFetcher(
+                pool_size=http_settings.get('pool_size', 16),
+                timeout=http_settings.get('timeout', 15),
+                retries=http_settings.get('retries', 2)
+            )
+        return self.http_fetcher
+
+    def get_async_fetcher(self):
+        """Asyncio fetcher built from global_settings.http_settings"""
+        http_settings = self.config.get('global_settings', {}).get('http_settings', {})
+        return AsyncFetcher(
+            concurrency=http_settings.get('async_concurrency', 64),
+            per_host=http_settings.get('per_host_limit', 16),
+            timeout=http_settings.get('timeout', 15)
+        )
+
+    def validate_course_urls(self, content_type, courses=None):
+        """Check every generated course URL concurrently and report broken ones"""
+        if courses is None:
+            courses = self.load_course_list(content_type)
+        if not courses:
+            return {}
+
+        start_time = time.time()
+        statuses = self.get_async_fetcher().validate_urls([c['url'] for c in courses])
+        broken = [c for c in courses if not statuses[c['url']]['ok']]
+
+        print(f"Validated {len(statuses)} {content_type} URLs in {time.time() - start_time:.1f}s")
+        for course_data in broken:
+            status = statuses[course_data['url']]
+            print(f"  Broken ({status['status'] or status['error']}): {course_data['url']}")
+
+        return statuses
+
     def load_course_list(self, content_type):
         """Load course list for specific content type"""
         content_config = self.config['course_types'].get(content_type)
@@ -142,147 +425,214 @@ class UniversalGenesysExtractor:
 
         return slug
 
-    def extract_target_audience_enhanced(self, page_text):
-        """Enhanced target audience extraction using proven header pattern"""
-        # Comprehensive standardized audience types from production extraction
-        audience_types = {
-            'developer': 'Developers',
-            'developers': 'Developers',
-            'system administrator': 'System Administrators',
-            'system administrators': 'System Administrators',
-            'administrator': 'Administrators',
-            'administrators': 'Administrators',
-            'admin': 'Administrators',
-            'supervisor': 'Supervisors',
-            'supervisors': 'Supervisors',
-            'manager': 'Managers',
-            'managers': 'Managers',
-            'agent': 'Agents',
-            'agents': 'Agents',
-            'contact center agent': 'Agents',
-            'contact center agents': 'Agents',
-            'business user': 'Business Users',
-            'business users': 'Business Users',
-            'analyst': 'Analysts',
-            'analysts': 'Analysts',
-            'contact center manager': 'Contact Center Managers',
-            'contact center administrator': 'System Administrators',
-            'quality manager': 'Managers',
-            'workforce manager': 'Managers',
-            'it professional': 'IT Professionals',
-            'it professionals': 'IT Professionals',
-            'it': 'IT Professionals'
-        }
-
-        # Comprehensive header patterns proven in production extraction
-        header_patterns = [
-            r'Target\s+Audience[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'Intended\s+Audience[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'Who\s+Should\s+Attend[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'This\s+(?:course|eLearning)\s+is\s+(?:for|intended\s+for)[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'Designed\s+for[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'Suitable\s+for[:\s]*([^\.]+?)(?:Course\s+(?:Objectives|Prerequisites))',
-            r'Target\s+Audience[:\s]*([^\.]+?)(?:Overview|Introduction)',
-            r'Intended\s+Audience[:\s]*([^\.]+?)(?:Overview|Introduction)'
-        ]
-
-        def detect_audiences_in_text(text):
-            detected = []
-            text_lower = text.lower()
-
-            for key, standard_name in audience_types.items():
-                if key in text_lower and standard_name not in detected:
-                    detected.append(standard_name)
+    def extract_target_audience_enhanced(self, page_text, sections=None):
+        """Target audience from the page's audience sections (Target Audience, Who Should Attend, ...)"""
+        sections = sections or segment_page(page_text)
 
-            return detected
-
-        # Try header patterns first
-        for pattern in header_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                context = match.group(1).strip()
-                detected = detect_audiences_in_text(context)
-                if detected:
-                    return detected, "Header pattern"
+        for section in sections.sections('target_audience', max_length=AUDIENCE_WINDOW):
+            # The audience list ends at the first sentence break
+            context = section.split('.', 1)[0]
+            detected = self.detect_audiences_in_text(context)
+            if detected:
+                return detected, "Header pattern"
 
         return [], "Not found"
 
-    def extract_content_info(self, content_type, course_data):
+    def detect_audiences_in_text(self, text):
+        """Map audience mentions in text onto standardized audience types"""
+        return self.audience_matcher.find(text)
+
+    def extract_content_info(self, content_type, course_data, driver=None, raise_errors=False):
         """Extract information for a specific course"""
+        driver = driver or self.driver
+        readiness = self.config.get('global_settings', {}).get('page_readiness', {})
+        return self.extract_with_fetcher(content_type, course_data, SeleniumFetcher(driver, readiness),
+                                         raise_errors=raise_errors)
+
+    def extract_with_fetcher(self, content_type, course_data, fetcher, raise_errors=False):
+        """Fetch a course page from any Fetcher and extract its information"""
+        result = self.fetch_course_page(content_type, course_data, fetcher, raise_errors=raise_errors)
+        if result is None:
+            return self.failed_content(content_type, course_data)
+        return self.extract_fetched(content_type, course_data, result, raise_errors=raise_errors)
+
+    def fetch_course_page(self, content_type, course_data, fetcher, raise_errors=False, preload=False):
+        """Fetch stage: load a course page, returning a FetchResult or None on failure
+
+        With preload the page source is read right away, so the fetcher's
+        browser can move on before the page is parsed.
+        """
         content_config = self.config['course_types'][content_type]
-        extraction_settings = content_config['extraction_settings']
 
         print(f"Loading: {course_data['title'][:60]}...")
 
         try:
-            # Load the page
-            self.driver.get(course_data['url'])
-
-            # Wait for content to load
-            wait_time = extraction_settings.get('wait_time', 10)
-            print(f"  Waiting {wait_time}s for content...")
-            time.sleep(wait_time)
-
-            # Get page source and parse
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            page_text = soup.get_text()
-
-            # Create content object
-            content = LearningContent(
-                title=course_data['title'],
-                url=course_data['url'],
-                content_type=content_type,
-                extraction_timestamp=datetime.now().isoformat(),
-                page_length=len(page_text)
-            )
+            result = fetcher.fetch(course_data['url'], content_config)
+            if result.ready:
+                print(f"  Ready after {result.time_to_ready:.1f}s")
+            else:
+                print(f"  Not ready after {result.time_to_ready:.1f}s, using current page")
+
+            if preload:
+                # Snapshots need the HTML even when in-page extraction does not
+                if result.page_fields is None or self.snapshot_dir:
+                    result.page_source
+                # The driver goes back to the pool next, so nothing may read from it later
+                result.detach()
+            return result
 
-            # Extract description
-            if extraction_settings.get('extract_descriptions', True):
-                content.description = self.extract_description(soup, content_config['css_selectors'])
-
-            # Extract target audience
-            if extraction_settings.get('extract_target_audience', True):
-                print(f"  Searching for target audience...")
-                audiences, method = self.extract_target_audience_enhanced(page_text)
-                content.target_audience = audiences
-                if audiences:
-                    print(f"    Found: {', '.join(audiences)}")
-                else:
-                    print(f"  - No target audience found")
+        except Exception as e:
+            # Browser/navigation failures are left to the caller to retry on a new driver
+            if raise_errors and isinstance(e, WebDriverException):
+                raise
+            print(f"  Error extracting {course_data['title']}: {e}")
+            return None
 
-            # Extract duration
-            if extraction_settings.get('extract_duration', True):
-                content.duration = self.extract_duration(page_text)
+    def extract_fetched(self, content_type, course_data, result, raise_errors=False):
+        """Parse stage: extract a fetched page, returning minimal content on failure"""
+        try:
+            return self.extract_from_fetch_result(content_type, course_data, result)
+        except Exception as e:
+            if raise_errors and isinstance(e, WebDriverException):
+                raise
+            print(f"  Error extracting {course_data['title']}: {e}")
+            return self.failed_content(content_type, course_data)
+
+    def failed_content(self, content_type, course_data, status='error'):
+        """Minimal content object for a course that could not be extracted"""
+        return LearningContent(
+            title=course_data['title'],
+            url=course_data['url'],
+            content_type=content_type,
+            extraction_timestamp=datetime.now().isoformat(),
+            extraction_status=status
+        )
+
+    def extract_from_fetch_result(self, content_type, course_data, result):
+        """Extract content from a FetchResult, preferring captured API payloads"""
+        content = None
+        if result.api_payloads is not None:
+            content = self.extract_from_api_payloads(content_type, course_data, result.api_payloads)
+            if content is None:
+                print(f"  No usable API payload, falling back to page source")
+
+        if content is None and result.page_fields is not None:
+            content = self.extract_from_document(content_type, course_data, InPageDocument(result.page_fields))
+
+        if content is None:
+            content = self.parse_page_source(content_type, course_data, result.page_source)
+
+        if self.snapshot_dir:
+            RecordedFetcher.save_snapshot(self.snapshot_dir, course_data['url'],
+                                          result.page_source, result.time_to_ready)
+
+        content.time_to_ready = round(result.time_to_ready, 2)
+        content.extraction_status = 'blocked' if self.is_soft_blocked(result) else 'ok'
+        return content
+
+    def parse_page_source(self, content_type, course_data, page_source):
+        """Run HTML extraction in the parse pool when one is configured, else inline"""
+        parse_pool = self.get_parse_pool()
+        if parse_pool:
+            return parse_pool.parse(content_type, course_data, page_source)
+        return self.extract_from_page_source(content_type, course_data, page_source)
+
+    def extract_from_page_source(self, content_type, course_data, page_source):
+        """Parse rendered HTML and extract the configured fields"""
+        return self.extract_from_document(content_type, course_data, parse_html(page_source, self.parser_backend))
+
+    def extract_from_document(self, content_type, course_data, document):
+        """Extract the configured fields from a parsed page (see utils.html_parsing)"""
+        content_config = self.config['course_types'][content_type]
+        extraction_settings = content_config['extraction_settings']
 
-            # Extract course outline
-            if extraction_settings.get('extract_course_outline', True):
-                content.course_outline = self.extract_course_outline(soup, content_config['css_selectors'])
+        page_text = document.text()
+        sections = segment_page(page_text)
+
+        # Create content object
+        content = LearningContent(
+            title=course_data['title'],
+            url=course_data['url'],
+            content_type=content_type,
+            extraction_timestamp=datetime.now().isoformat(),
+            page_length=len(page_text),
+            block_marker=self.find_block_marker(page_text)
+        )
+
+        # Extract description
+        if extraction_settings.get('extract_descriptions', True):
+            content.description = self.extract_description(document, content_config['css_selectors'])
+
+        # Extract target audience
+        if extraction_settings.get('extract_target_audience', True):
+            print(f"  Searching for target audience...")
+            audiences, method = self.extract_target_audience_enhanced(page_text, sections)
+            content.target_audience = audiences
+            if audiences:
+                print(f"    Found: {', '.join(audiences)}")
+            else:
+                print(f"  - No target audience found")
+
+        # Extract duration
+        if extraction_settings.get('extract_duration', True):
+            content.duration, content.duration_minutes = self.extract_duration(page_text, sections)
+
+        # Extract course outline
+        if extraction_settings.get('extract_course_outline', True):
+            content.course_outline = self.extract_course_outline(document, content_config['css_selectors'])
+
+        # Set learning type based on content type
+        content.learning_type = content_config['name']
+
+        return content
+
+    def extract_from_api_payloads(self, content_type, course_data, payloads):
+        """Build content from the JSON responses captured while the page loaded"""
+        content_config = self.config['course_types'][content_type]
+        extraction_settings = content_config['extraction_settings']
+        field_map = extraction_settings.get('api_capture', {}).get('field_map')
 
-            # Set learning type based on content type
-            content.learning_type = content_config['name']
+        record = find_course_record(payloads, course_data, field_map)
+        if record is None:
+            return None
 
-            return content
+        payload_fields = fields_from_record(record, field_map)
+        if not payload_fields.get('description') and not payload_fields.get('course_outline'):
+            return None
 
-        except Exception as e:
-            print(f"  Error extracting {course_data['title']}: {e}")
-            # Return minimal content object
-            return LearningContent(
-                title=course_data['title'],
-                url=course_data['url'],
-                content_type=content_type,
-                extraction_timestamp=datetime.now().isoformat()
+        print(f"  Captured {len(payloads)} JSON responses")
+        content = LearningContent(
+            title=course_data['title'],
+            url=course_data['url'],
+            content_type=content_type,
+            learning_type=content_config['name'],
+            extraction_timestamp=datetime.now().isoformat(),
+            page_length=len(json.dumps(record))
+        )
+
+        if extraction_settings.get('extract_descriptions', True):
+            content.description = payload_fields.get('description', '')
+        if extraction_settings.get('extract_target_audience', True):
+            content.target_audience = self.detect_audiences_in_text(
+                ' , '.join(payload_fields.get('target_audience', []))
             )
+        if extraction_settings.get('extract_duration', True):
+            # Numeric payload durations (durationMinutes, length) are minutes
+            content.duration, content.duration_minutes = parse_duration(payload_fields.get('duration', ''),
+                                                                        bare_unit='minutes')
+        if extraction_settings.get('extract_course_outline', True):
+            content.course_outline = payload_fields.get('course_outline', [])
+
+        return content
 
-    def extract_description(self, soup, css_selectors):
+    def extract_description(self, document, css_selectors):
         """Extract description using CSS selectors"""
         selectors = css_selectors.get('description', [])
 
         for selector in selectors:
             try:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text().strip()
+                for text in document.select_texts(selector):
+                    text = text.strip()
                     if text and len(text) > 50:  # Minimum length for valid description
                         # Clean up the text
                         text = re.sub(r'\s+', ' ', text)
@@ -292,37 +642,25 @@ class UniversalGenesysExtractor:
 
         return ""
 
-    def extract_duration(self, page_text):
-        """Extract duration from page text"""
-        duration_patterns = [
-            r'(\d+)\s*(?:hours?|hrs?)',
-            r'(\d+)\s*(?:minutes?|mins?)',
-            r'(\d+)\s*(?:hours?|hrs?)\s*(\d+)\s*(?:minutes?|mins?)',
-            r'Duration[:\s]*(\d+\s*(?:hours?|hrs?|minutes?|mins?))',
-            r'Time[:\s]*(\d+\s*(?:hours?|hrs?|minutes?|mins?))'
-        ]
-
-        for pattern in duration_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 2:  # Hours and minutes
-                    hours, minutes = match.groups()
-                    return f"{hours} hrs {minutes} mins"
-                else:
-                    return match.group(1)
-
-        return ""
-
-    def extract_course_outline(self, soup, css_selectors):
+    def extract_duration(self, page_text, sections=None):
+        """Duration as (display string, minutes) from the Duration section, or the whole page text"""
+        sections = sections or segment_page(page_text)
+        duration_section = sections.first('duration')
+        if duration_section:
+            duration, minutes = parse_duration(duration_section)
+            if minutes is not None:
+                return duration, minutes
+        return parse_duration(page_text)
+
+    def extract_course_outline(self, document, css_selectors):
         """Extract course outline using CSS selectors"""
         selectors = css_selectors.get('course_outline', [])
 
         for selector in selectors:
             try:
-                elements = soup.select(selector)
                 outline = []
-                for element in elements:
-                    text = element.get_text().strip()
+                for text in document.select_texts(selector):
+                    text = text.strip()
                     if text and len(text) > 10:
                         outline.append(text)
 
@@ -334,70 +672,63 @@ class UniversalGenesysExtractor:
         return []
 
     def save_results(self, content_type, results):
-        """Save results for specific content type"""
+        """Stream results for a specific content type into its JSON, CSV and Parquet files"""
         content_config = self.config['course_types'][content_type]
         output_files = content_config['output_files']
+        result_store = self.get_result_store()
+        store_batch = []
+        stored = 0
 
-        # Prepare data for saving
-        results_data = {
+        writer = DatasetWriter(output_files['json'], output_files['csv'], self.parquet_path(output_files))
+        try:
+            for content in results:
+                data = content.to_dict()
+                writer.write(item_record(data))
+
+                # Upsert into the result store, replacing earlier rows for the same URLs
+                if result_store:
+                    store_batch.append(data)
+                    if len(store_batch) >= result_store.batch_size:
+                        result_store.upsert(store_batch, start_position=stored)
+                        stored += len(store_batch)
+                        store_batch = []
+            if store_batch:
+                result_store.upsert(store_batch, start_position=stored)
+        except BaseException:
+            writer.abort()
+            raise
+
+        summary = writer.close({
             'extraction_info': {
                 'content_type': content_type,
                 'extraction_date': datetime.now().isoformat(),
-                'total_items': len(results),
-                'successful_extractions': len([r for r in results if r.description or r.target_audience]),
+                'total_items': writer.total_items,
+                'successful_extractions': writer.successful,
                 'content_type_config': content_config['name']
             },
-            'items': []
-        }
-
-        for content in results:
-            item_data = {
-                'title': content.title,
-                'url': content.url,
-                'content_type': content.content_type,
-                'description': content.description,
-                'learning_type': content.learning_type,
-                'duration': content.duration,
-                'course_outline': content.course_outline,
-                'target_audience': content.target_audience,
-                'extraction_timestamp': content.extraction_timestamp
-            }
-            results_data['items'].append(item_data)
-
-        # Save JSON
-        json_file = output_files['json']
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False)
-
-        # Save CSV
-        csv_file = output_files['csv']
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'title', 'url', 'content_type', 'description', 'learning_type',
-                'duration', 'course_outline', 'target_audience'
-            ])
-
-            for content in results:
-                writer.writerow([
-                    content.title,
-                    content.url,
-                    content.content_type,
-                    content.description,
-                    content.learning_type,
-                    content.duration,
-                    ' | '.join(content.course_outline) if content.course_outline else '',
-                    ' | '.join(content.target_audience) if content.target_audience else ''
-                ])
+            'statistics': writer.statistics()
+        })
 
         print(f"Results saved:")
-        print(f"  JSON: {json_file}")
-        print(f"  CSV: {csv_file}")
-
-        return results_data
+        print(f"  JSON: {output_files['json']}")
+        print(f"  CSV: {output_files['csv']}")
+        if writer.parquet_writer:
+            print(f"  Parquet: {output_files['parquet']}")
+        if result_store:
+            print(f"  SQLite: {result_store.db_path}")
+
+        return summary
+
+    def parquet_path(self, output_files):
+        """Configured Parquet file, or None when unset or pyarrow is missing"""
+        parquet_file = output_files.get('parquet')
+        if parquet_file and not parquet_available():
+            print(f"  Parquet: skipped, pyarrow is not installed")
+            return None
+        return parquet_file
 
-    def extract_content_type(self, content_type):
-        """Extract all content for a specific type"""
+    def extract_content_type(self, content_type, resume=False):
+        """Extract all content for a specific type; resume skips courses already extracted"""
         print(f"\n=== Extracting {content_type.upper()} Content ===")
 
         # Load course list
@@ -405,121 +736,626 @@ class UniversalGenesysExtractor:
         if not courses:
             return []
 
-        # Setup driver if needed
-        if not self.driver:
-            if not self.setup_driver():
+        # Optionally drop courses whose URL does not resolve
+        if self.config.get('global_settings', {}).get('http_settings', {}).get('validate_urls', False):
+            statuses = self.validate_course_urls(content_type, courses)
+            courses = [c for c in courses if statuses[c['url']]['ok']]
+            if not courses:
                 return []
 
-        results = []
-        total_courses = len(courses)
+        remaining = courses
+        finished = {}
+        recovered = []
+        if resume:
+            finished = self.load_finished_results(content_type)
+            # Courses an interrupted sharded run finished after its checkpoint was last written
+            recovered = [record for record in self.leftover_shard_results(content_type)
+                         if record['url'] not in finished]
+            for record in recovered:
+                finished[record['url']] = record
+            remaining = [c for c in courses if c['url'] not in finished]
+            print(f"Resuming: {len(courses) - len(remaining)} already extracted, {len(remaining)} remaining")
+
+        # Every finished item is appended to the checkpoint as it completes
+        checkpoint = self.open_checkpoint(content_type)
+        on_complete = lambda index, content: checkpoint.append(content.to_dict())
+        with checkpoint.open(truncate=not resume):
+            if resume and os.path.getsize(checkpoint.path) == 0:
+                # Resuming from a previous run's output file rather than a checkpoint
+                recovered = finished.values()
+            for record in recovered:
+                checkpoint.append(record)
+
+            if remaining and self.get_shard_count() > 1:
+                self.extract_courses_sharded(content_type, remaining, on_complete=on_complete)
+            elif remaining:
+                self.extract_courses(content_type, remaining, on_complete=on_complete)
+
+        # Save final results, read back from the checkpoint in input order
+        results = self.results_from_checkpoint(checkpoint.path, courses)
+        if not results:
+            return []
+        summary = self.save_results(content_type, results)
 
-        for i, course_data in enumerate(courses, 1):
-            print(f"\n[{i}/{total_courses}] ", end="")
+        print(f"\n=== {content_type.upper()} Extraction Complete ===")
+        print(f"Total items processed: {summary['extraction_info']['total_items']}")
+        print(f"Items with descriptions: {summary['statistics']['with_descriptions']}")
+        print(f"Items with target audiences: {summary['statistics']['with_target_audience']}")
 
+        return results
+
+    def checkpoint_path(self, content_type):
+        """Checkpoint log file for a content type"""
+        checkpoint_dir = self.config.get('global_settings', {}).get('checkpoint', {}).get(
+            'dir', 'data/output/checkpoints')
+        return os.path.join(checkpoint_dir, f"{content_type}.jsonl")
+
+    def open_checkpoint(self, content_type):
+        """Checkpoint log configured in global_settings.checkpoint"""
+        checkpoint_settings = self.config.get('global_settings', {}).get('checkpoint', {})
+        return CheckpointLog(self.checkpoint_path(content_type), fsync=checkpoint_settings.get('fsync', False))
+
+    def load_finished_results(self, content_type):
+        """Successfully extracted result dicts by URL, from the checkpoint or else the JSON output"""
+        records = load_checkpoint(self.checkpoint_path(content_type))
+        if not records:
+            json_file = self.config['course_types'][content_type]['output_files']['json']
+            if os.path.exists(json_file):
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    records = {item['url']: item for item in json.load(f).get('items', [])}
+
+        return {url: record for url, record in records.items() if self.is_finished_record(record)}
+
+    def is_finished_record(self, record):
+        """Whether a saved result needs no further extraction"""
+        status = record.get('extraction_status')
+        if status:
+            return status == 'ok'
+        # Outputs from before extraction_status was recorded
+        return bool(record.get('description') or record.get('target_audience'))
+
+    def results_from_checkpoint(self, path, courses):
+        """Checkpointed results as LearningContent, ordered like the course list and read lazily"""
+        return CheckpointResults(path, [course['url'] for course in courses], LearningContent.from_dict)
+
+    def leftover_shard_results(self, content_type):
+        """Finished result dicts left in shard files by an interrupted sharded run"""
+        shard_dir = self.config.get('global_settings', {}).get('sharding', {}).get('shard_dir', 'data/output/shards')
+        return [record for record in leftover_shard_records(shard_dir, content_type)
+                if self.is_finished_record(record)]
+
+    def extract_courses(self, content_type, courses, on_complete=None, on_dead_letter=None, local_retries=True):
+        """Extract a list of courses in this process, returning results in input order
+
+        on_dead_letter(index, reason) is called for courses that failed for good;
+        local_retries=False leaves retrying to the caller (e.g. the work queue).
+        """
+        # Setup driver pool if needed (HTTP types only start Chrome for fallbacks)
+        extraction_settings = self.config['course_types'][content_type]['extraction_settings']
+        use_browser = extraction_settings.get('use_browser_automation', True)
+        if not self.setup_driver_pool(warm=use_browser):
+            return []
+
+        if use_browser:
+            worker_count = self.driver_pool.size
+        else:
+            http_settings = self.config.get('global_settings', {}).get('http_settings', {})
+            worker_count = http_settings.get('concurrency', 16)
+            print(f"Using plain HTTP backend ({worker_count} parse workers)")
+
+        if use_browser and self.get_tab_count() > 1:
+            return self.extract_courses_in_tabs(content_type, courses, on_complete, on_dead_letter, local_retries)
+
+        # HTTP types fetch every page concurrently up front
+        prefetched = {}
+        if not use_browser:
             start_time = time.time()
-            content = self.extract_content_info(content_type, course_data)
-            end_time = time.time()
+            prefetched = self.get_async_fetcher().fetch_pages([c['url'] for c in courses])
+            print(f"Fetched {len(prefetched)} pages in {time.time() - start_time:.1f}s")
 
-            results.append(content)
+        total_courses = len(courses)
+        results = [None] * total_courses
+        completed = 0
+
+        if use_browser and worker_count > 1:
+            print(f"Using {worker_count} parallel Chrome workers")
+
+        # Optional AIMD controller decides how many of the workers are used at a time
+        controller = self.create_concurrency_controller(worker_count) if use_browser else None
+        retries = self.create_retry_scheduler(content_type, local_retries)
+        pending = deque(enumerate(courses))
+        in_flight = {}
+
+        # With a parse pool, extra threads wait on parsing so every driver keeps loading pages
+        parse_depth = 0
+        if use_browser and self.get_parse_pool():
+            parse_settings = self.config.get('global_settings', {}).get('parse_pool', {})
+            parse_depth = parse_settings.get('queue_size') or worker_count
+
+        # Hand courses to free workers, keeping results in input order
+        with ThreadPoolExecutor(max_workers=worker_count + parse_depth) as executor:
+            while pending or in_flight or len(retries):
+                pending.extend(retries.pop_ready())
+
+                limit = (controller.limit if controller else worker_count) + parse_depth
+                while pending and len(in_flight) < limit:
+                    index, course_data = pending.popleft()
+                    # Retries fetch the page again instead of reusing the prefetched copy
+                    page = None if index in retries.attempts else prefetched.get(course_data['url'])
+                    future = executor.submit(self.extract_with_pool, content_type, course_data, page)
+                    in_flight[future] = (index, course_data)
+
+                if not in_flight:
+                    time.sleep(retries.next_delay() or 0)
+                    continue
+
+                done, _ = wait(in_flight, timeout=retries.next_delay(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, course_data = in_flight.pop(future)
+                    try:
+                        content, elapsed = future.result()
+                    except Exception as e:
+                        print(f"  Worker failed on {course_data['title'][:60]}: {e}")
+                        content, elapsed = None, 0.0
+
+                    status = content.extraction_status if content else 'error'
+                    if controller:
+                        controller.record(elapsed, error=status == 'error',
+                                          blocked=status == 'blocked' or bool(content and content.block_marker))
+
+                    # Failed pages go back in the retry queue instead of being recorded as results
+                    if status in RETRYABLE_STATUSES:
+                        if not retries.schedule(index, course_data, status) and on_dead_letter:
+                            on_dead_letter(index, status)
+                        continue
+
+                    results[index] = content
+                    completed += 1
+
+                    print(f"\n[{completed}/{total_courses}] Done: {content.title[:60]}")
+                    print(f"  Time: {elapsed:.1f}s")
+
+                    if on_complete:
+                        on_complete(index, content)
+
+        if retries.dead_letters and retries.dead_letter_file:
+            print(f"{retries.dead_letters} courses failed after retries, see {retries.dead_letter_file}")
+
+        return [content for content in results if content is not None]
+
+    def create_retry_scheduler(self, content_type, local_retries=True):
+        """Retry scheduler using global_settings.max_retries and global_settings.retry"""
+        global_settings = self.config.get('global_settings', {})
+        if not local_retries:
+            # Failures are handed straight back to the caller, which keeps its own attempt count
+            return RetryScheduler(max_retries=0)
+
+        retry_settings = global_settings.get('retry', {})
+        dead_letter_file = retry_settings.get('dead_letter_file', 'data/output/dead_letter_{content_type}.jsonl')
+        return RetryScheduler(
+            max_retries=global_settings.get('max_retries', 3),
+            base_delay=retry_settings.get('base_delay', 2.0),
+            max_delay=retry_settings.get('max_delay', 60.0),
+            dead_letter_file=dead_letter_file.format(content_type=content_type) if dead_letter_file else None
+        )
+
+    def create_concurrency_controller(self, worker_count):
+        """AIMD controller over the worker pool, or None when adaptive concurrency is off"""
+        settings = self.config.get('global_settings', {}).get('adaptive_concurrency', {})
+        if not settings.get('enabled', False) or worker_count <= 1:
+            return None
 
-            print(f"  Time: {end_time - start_time:.1f}s")
+        return AimdController(
+            initial=settings.get('initial', 2),
+            minimum=settings.get('min', 1),
+            maximum=worker_count,
+            increase=settings.get('increase', 1),
+            decrease_factor=settings.get('decrease_factor', 0.5),
+            latency_target=settings.get('latency_target'),
+            error_threshold=settings.get('error_threshold', 0.2)
+        )
+
+    def is_soft_blocked(self, result):
+        """Whether the server answered with a throttling or bot-challenge status"""
+        return result.status in BLOCK_STATUSES
+
+    def find_block_marker(self, page_text):
+        """First block_markers entry in a page's visible text, when adaptive concurrency is on
+
+        A marker only slows the controller down; the extracted content is kept.
+        """
+        settings = self.config.get('global_settings', {}).get('adaptive_concurrency', {})
+        markers = settings.get('block_markers', [])
+        if not settings.get('enabled', False) or not markers:
+            return ""
+
+        # Visible text only, so scripts such as recaptcha/api.js do not count
+        page_text = page_text.lower()
+        for marker in markers:
+            if marker.lower() in page_text:
+                return marker
+        return ""
 
-            # Save progress periodically
-            save_interval = self.config.get('global_settings', {}).get('progress_save_interval', 20)
-            if i % save_interval == 0:
-                print(f"  Saved progress to {content_type}_progress_{i}.json")
-                temp_data = self.save_results(f"{content_type}_temp", results)
+    def extract_courses_in_tabs(self, content_type, courses, on_complete=None, on_dead_letter=None,
+                                local_retries=True):
+        """Extract courses with several tabs loading concurrently in each pooled driver"""
+        content_config = self.config['course_types'][content_type]
+        readiness = self.config.get('global_settings', {}).get('page_readiness', {})
+        tab_count = self.get_tab_count()
+        worker_count = self.driver_pool.size
 
-        # Save final results
-        final_data = self.save_results(content_type, results)
+        total_courses = len(courses)
+        results = [None] * total_courses
+        progress = {'completed': 0, 'finished': 0}
+        lock = threading.Lock()
+        retries = self.create_retry_scheduler(content_type, local_retries)
+        poll_interval = readiness.get('poll_interval', 0.25)
+
+        work_queue = queue.Queue()
+        for index, course_data in enumerate(courses):
+            work_queue.put((index, course_data))
+
+        print(f"Using {tab_count} tabs in each of {worker_count} Chrome workers")
+
+        def record(index, content):
+            if content.extraction_status in RETRYABLE_STATUSES:
+                if retries.schedule(index, courses[index], content.extraction_status):
+                    return
+                if on_dead_letter:
+                    on_dead_letter(index, content.extraction_status)
+                with lock:
+                    progress['finished'] += 1
+                return
+
+            with lock:
+                results[index] = content
+                progress['completed'] += 1
+                progress['finished'] += 1
+                print(f"\n[{progress['completed']}/{total_courses}] Done: {content.title[:60]}")
+                print(f"  Time to ready: {content.time_to_ready:.1f}s")
+                if on_complete:
+                    on_complete(index, content)
+
+        def harvest(driver, course_data, ready, elapsed):
+            return self.harvest_tab(content_type, course_data, driver, ready, elapsed)
+
+        def run_worker():
+            # Each lease runs until the driver's page budget is spent, then it may be recycled
+            while progress['finished'] < total_courses:
+                for item in retries.pop_ready():
+                    work_queue.put(item)
+                if work_queue.empty():
+                    # Remaining courses are loading in other workers or waiting out a backoff
+                    time.sleep(min(retries.next_delay() or poll_interval, poll_interval * 4))
+                    continue
+
+                try:
+                    with self.driver_pool.lease() as driver:
+                        scheduler = TabScheduler(
+                            driver,
+                            tab_count,
+                            collect_selectors(content_config.get('css_selectors')),
+                            timeout=content_config['extraction_settings'].get('wait_time', 10),
+                            quiet_period=readiness.get('quiet_period', 1.0),
+                            poll_interval=poll_interval
+                        )
+                        pages = scheduler.run(work_queue, harvest, record,
+                                              max_items=self.driver_pool.pages_left(driver))
+                        self.driver_pool.record_pages(driver, pages)
+                except WebDriverException as e:
+                    # In-flight items were put back on the queue by the scheduler
+                    print(f"  Browser error in tab worker, continuing with a new browser: {e}")
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            for future in [executor.submit(run_worker) for _ in range(worker_count)]:
+                future.result()
+
+        if retries.dead_letters and retries.dead_letter_file:
+            print(f"{retries.dead_letters} courses failed after retries, see {retries.dead_letter_file}")
+
+        return [content for content in results if content is not None]
+
+    def harvest_tab(self, content_type, course_data, driver, ready, elapsed):
+        """Extract the page currently shown in a ready (or timed out) tab"""
+        if not ready:
+            print(f"  Not ready after {elapsed:.1f}s, using current page: {course_data['title'][:60]}")
 
-        print(f"\n=== {content_type.upper()} Extraction Complete ===")
-        print(f"Total items processed: {len(results)}")
-        print(f"Items with descriptions: {len([r for r in results if r.description])}")
-        print(f"Items with target audiences: {len([r for r in results if r.target_audience])}")
+        content_config = self.config['course_types'][content_type]
+        extraction_mode = content_config['extraction_settings'].get('extraction_mode', 'dom')
 
-        return results
+        try:
+            page_fields = None
+            if extraction_mode == 'in_page':
+                page_fields = collect_page_fields(driver, content_config.get('css_selectors'))
+
+            # The tab stays current until extraction returns, so page_source can still be read lazily
+            result = FetchResult(course_data['url'], elapsed=elapsed, time_to_ready=elapsed, ready=ready,
+                                 backend='selenium', page_fields=page_fields,
+                                 source_loader=lambda: driver.page_source)
+            return self.extract_from_fetch_result(content_type, course_data, result)
+        except Exception as e:
+            print(f"  Error extracting {course_data['title']}: {e}")
+            return self.failed_content(content_type, course_data)
+
+    def get_shard_count(self):
+        """Number of extraction worker processes (CLI override, then config)"""
+        if self.shard_count:
+            return max(1, int(self.shard_count))
+        return max(1, int(self.config.get('global_settings', {}).get('shard_count', 1)))
+
+    def extract_courses_sharded(self, content_type, courses, on_complete=None):
+        """Extract courses across several worker processes, returning how many finished
+
+        on_complete(index, content) is called in this process as each shard reports a course.
+        """
+        shard_settings = self.config.get('global_settings', {}).get('sharding', {})
+
+        def report(index, record):
+            if on_complete:
+                on_complete(index, LearningContent.from_dict(record))
+
+        finished, failed_shards, dead_letters = run_shards(
+            self.config_file,
+            content_type,
+            courses,
+            self.get_shard_count(),
+            shard_dir=shard_settings.get('shard_dir', 'data/output/shards'),
+            retries=shard_settings.get('retries', 1),
+            extractor_options={'worker_count': self.worker_count, 'tab_count': self.tab_count},
+            on_result=report,
+            poll_interval=shard_settings.get('poll_interval', 1.0)
+        )
+
+        if dead_letters:
+            print(f"{len(dead_letters)} courses failed after retries in their shards")
+
+        missing = [course_data['title'] for i, course_data in enumerate(courses)
+                   if i not in finished and i not in dead_letters]
+        if missing:
+            print(f"Warning: {len(missing)} courses lost in failed shards {failed_shards}:")
+            for title in missing:
+                print(f"  - {title}")
+
+        return len(finished)
+
+    def extract_with_pool(self, content_type, course_data, prefetched=None):
+        """Extract one course on a pooled driver, returning (content, elapsed)
+
+        elapsed leaves out time spent waiting for a free driver, so it is a page latency sample.
+        """
+        timing = {'start': time.time()}
+        extraction_settings = self.config['course_types'][content_type]['extraction_settings']
+
+        if not extraction_settings.get('use_browser_automation', True):
+            content = self.extract_with_http(content_type, course_data, prefetched)
+            if content is not None:
+                return content, time.time() - timing['start']
+
+        # A navigation error recycles the driver and the course is retried on a fresh one
+        retry_on_new_driver = self.driver_pool.recycle_on_error
+        try:
+            content = self.extract_on_pooled_driver(content_type, course_data, raise_errors=retry_on_new_driver,
+                                                    timing=timing)
+        except WebDriverException as e:
+            print(f"  Browser error on {course_data['title'][:60]}, retrying with a new browser: {e}")
+            content = self.extract_on_pooled_driver(content_type, course_data, timing=timing)
+
+        return content, time.time() - timing['start']
+
+    def extract_on_pooled_driver(self, content_type, course_data, raise_errors=False, timing=None):
+        """Fetch a course on a leased driver and extract it
+
+        timing['start'] is reset once the driver has been acquired.
+        """
+        timing = {} if timing is None else timing
+        if not self.get_parse_pool():
+            with self.driver_pool.lease() as driver:
+                timing['start'] = time.time()
+                self.driver_pool.record_pages(driver)
+                return self.extract_content_info(content_type, course_data, driver, raise_errors=raise_errors)
+
+        # Pipelined: the driver goes back to the pool before the page is parsed
+        readiness = self.config.get('global_settings', {}).get('page_readiness', {})
+        with self.driver_pool.lease() as driver:
+            timing['start'] = time.time()
+            self.driver_pool.record_pages(driver)
+            result = self.fetch_course_page(content_type, course_data, SeleniumFetcher(driver, readiness),
+                                            raise_errors=raise_errors, preload=True)
+        if result is None:
+            return self.failed_content(content_type, course_data)
+        return self.extract_fetched(content_type, course_data, result)
+
+    def extract_with_http(self, content_type, course_data, prefetched=None):
+        """Extract a course from plain HTTP, or None when the browser is needed"""
+        extraction_settings = self.config['course_types'][content_type]['extraction_settings']
+
+        # Throttled or challenged: retry later rather than put more load on the site through Chrome
+        if prefetched and prefetched['status'] in BLOCK_STATUSES:
+            print(f"  HTTP {prefetched['status']} for {course_data['title'][:60]}, treating as blocked")
+            return self.failed_content(content_type, course_data, status='blocked')
+
+        if prefetched and prefetched['page_source'] is not None:
+            result = FetchResult(course_data['url'], prefetched['page_source'],
+                                 elapsed=prefetched['elapsed'], time_to_ready=prefetched['elapsed'],
+                                 status=prefetched['status'], backend='http')
+        else:
+            try:
+                result = self.get_http_fetcher().fetch(course_data['url'])
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                print(f"  HTTP fetch failed for {course_data['title'][:60]}: {e}")
+                if status in BLOCK_STATUSES:
+                    return self.failed_content(content_type, course_data, status='blocked')
+                return None
+            except Exception as e:
+                print(f"  HTTP fetch failed for {course_data['title'][:60]}: {e}")
+                return None
+
+        content = self.extract_from_fetch_result(content_type, course_data, result)
+
+        missing = self.missing_required_fields(content, extraction_settings)
+        if missing:
+            print(f"  HTTP page missing {', '.join(missing)}, falling back to browser")
+            return None
+
+        return content
+
+    def missing_required_fields(self, content, extraction_settings):
+        """Required fields that came back empty"""
+        required = extraction_settings.get('required_fields', ['description'])
+        return [field for field in required if not getattr(content, field, None)]
+
+    def open_work_queue(self, db_path=None, run_id=None):
+        """Open the shared work queue configured in global_settings.work_queue"""
+        queue_settings = self.config.get('global_settings', {}).get('work_queue', {})
+        return SqliteWorkQueue(
+            db_path or queue_settings.get('db_path', 'data/queue/extraction_queue.db'),
+            run_id=run_id or queue_settings.get('run_id', 'default'),
+            lease_seconds=queue_settings.get('lease_seconds', 120)
+        )
+
+    def enqueue_content_types(self, work_queue, content_types=None):
+        """Put the course lists of the given content types into the shared queue"""
+        if content_types is None:
+            content_types = list(self.config['course_types'].keys())
+
+        for content_type in content_types:
+            courses = self.load_course_list(content_type)
+            added = work_queue.enqueue(content_type, courses)
+            print(f"Queued {added} new {content_type} items (run '{work_queue.run_id}')")
+
+    def run_queue_worker(self, work_queue, content_types=None, worker_id=None):
+        """Claim queued courses under a lease, extract them and write results back until the run is done"""
+        worker_id = worker_id or default_worker_id()
+        queue_settings = self.config.get('global_settings', {}).get('work_queue', {})
+        max_attempts = queue_settings.get('max_attempts', self.config.get('global_settings', {}).get('max_retries', 3))
+        poll_interval = queue_settings.get('poll_interval', 5)
+        batch_size = queue_settings.get('batch_size') or self.get_worker_count() * self.get_tab_count()
+        content_types = content_types or work_queue.content_types()
+        processed = 0
+
+        print(f"=== Queue worker {worker_id} (run '{work_queue.run_id}') ===")
+
+        try:
+            with Heartbeat(work_queue, worker_id):
+                for content_type in content_types:
+                    while True:
+                        items = work_queue.claim(worker_id, content_type, limit=batch_size,
+                                                 max_attempts=max_attempts)
+                        if not items:
+                            # Other workers may still crash and release their leases
+                            counts = work_queue.counts(content_type)
+                            if not counts.get('pending') and not counts.get('leased'):
+                                break
+                            time.sleep(poll_interval)
+                            continue
+
+                        finished = set()
+                        released = set()
+
+                        def write_result(index, content):
+                            work_queue.complete(items[index]['id'], worker_id, content.to_dict())
+                            finished.add(index)
+
+                        def write_failure(index, reason):
+                            work_queue.fail(items[index]['id'], worker_id, reason, max_attempts)
+                            released.add(index)
+
+                        # The queue counts attempts across claims, so each claim gets one local attempt
+                        try:
+                            self.extract_courses(content_type, items, on_complete=write_result,
+                                                 on_dead_letter=write_failure, local_retries=False)
+                        finally:
+                            for index, item in enumerate(items):
+                                if index not in finished and index not in released:
+                                    work_queue.fail(item['id'], worker_id, "not extracted", max_attempts)
+
+                        processed += len(finished)
+        finally:
+            self.close_drivers()
+
+        print(f"\nQueue worker {worker_id} finished after {processed} items")
+        return processed
+
+    def collect_from_queue(self, work_queue):
+        """Write the per-type and combined outputs from results stored in the queue"""
+        all_results = {}
+        for content_type in work_queue.content_types():
+            if content_type not in self.config['course_types']:
+                print(f"Warning: Unknown content type '{content_type}' in queue")
+                continue
+
+            counts = work_queue.counts(content_type)
+            results = [LearningContent.from_dict(r) for r in work_queue.results(content_type)]
+            print(f"{content_type}: {len(results)} done, {counts.get('pending', 0) + counts.get('leased', 0)} "
+                  f"outstanding, {counts.get('failed', 0)} failed")
+
+            self.save_results(content_type, results)
+            all_results[content_type] = results
+
+        self.create_combined_dataset(all_results)
+        return all_results
 
     def create_combined_dataset(self, all_results):
-        """Create combined dataset from all content types"""
+        """Stream every content type's results into the combined JSON/CSV/Parquet files"""
         if not self.config.get('combined_output', {}).get('create_combined_dataset', False):
             return
 
         print("\n=== Creating Combined Dataset ===")
 
         combined_files = self.config['combined_output']['combined_files']
-        all_items = []
-
-        # Combine all results
-        for content_type, results in all_results.items():
-            all_items.extend(results)
-
-        # Create combined data structure
-        combined_data = {
-            'dataset_info': {
-                'name': self.config['project_info']['name'],
-                'version': self.config['project_info']['version'],
-                'creation_date': datetime.now().isoformat(),
-                'total_items': len(all_items),
-                'content_types': list(all_results.keys())
-            },
-            'statistics': {
-                'by_content_type': {
-                    ct: len(results) for ct, results in all_results.items()
-                },
-                'with_target_audience': len([item for item in all_items if item.target_audience]),
-                'with_descriptions': len([item for item in all_items if item.description])
-            },
-            'items': []
-        }
-
-        # Add all items
-        for item in all_items:
-            combined_data['items'].append({
-                'title': item.title,
-                'url': item.url,
-                'content_type': item.content_type,
-                'description': item.description,
-                'learning_type': item.learning_type,
-                'duration': item.duration,
-                'course_outline': item.course_outline,
-                'target_audience': item.target_audience,
-                'extraction_timestamp': item.extraction_timestamp
-            })
-
-        # Save combined JSON
-        with open(combined_files['json'], 'w', encoding='utf-8') as f:
-            json.dump(combined_data, f, indent=2, ensure_ascii=False)
-
-        # Save combined CSV
-        with open(combined_files['csv'], 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'title', 'url', 'content_type', 'description', 'learning_type',
-                'duration', 'course_outline', 'target_audience'
-            ])
-
-            for item in all_items:
-                writer.writerow([
-                    item.title,
-                    item.url,
-                    item.content_type,
-                    item.description,
-                    item.learning_type,
-                    item.duration,
-                    ' | '.join(item.course_outline) if item.course_outline else '',
-                    ' | '.join(item.target_audience) if item.target_audience else ''
-                ])
+        writer = CombinedDatasetWriter(combined_files['json'], combined_files['csv'], self.parquet_path(combined_files))
+        try:
+            for content_type, records in self.combined_sources(all_results):
+                for record in records:
+                    writer.write(item_record(record))
+        except BaseException:
+            writer.abort()
+            raise
+
+        summary = writer.close({
+            'name': self.config['project_info']['name'],
+            'version': self.config['project_info']['version'],
+            'creation_date': datetime.now().isoformat()
+        })
 
         print(f"Combined dataset created:")
         print(f"  JSON: {combined_files['json']}")
         print(f"  CSV: {combined_files['csv']}")
-        print(f"  Total items: {len(all_items)}")
+        if writer.parquet_writer:
+            print(f"  Parquet: {combined_files['parquet']}")
+        print(f"  Total items: {summary['dataset_info']['total_items']}")
+
+        return summary
+
+    def combined_sources(self, all_results):
+        """(content type, result dicts) for every type with results, this run's or saved on disk"""
+        # A result store already holds every type, streamed row by row
+        result_store = self.get_result_store()
+        if result_store:
+            for content_type in result_store.content_types():
+                yield content_type, result_store.results(content_type)
+            return
+
+        for content_type in self.config['course_types']:
+            results = all_results.get(content_type)
+            if results:
+                yield content_type, (content.to_dict() for content in results)
+            else:
+                # Not extracted in this run: merge its saved output
+                yield content_type, self.load_saved_items(content_type)
+
+    def load_saved_items(self, content_type):
+        """Items of a content type's saved JSON output, or none if it was never saved"""
+        json_file = self.config['course_types'][content_type]['output_files']['json']
+        if not os.path.exists(json_file):
+            return []
 
-        return combined_data
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get('items', [])
 
-    def run_extraction(self, content_types=None):
-        """Run extraction for specified content types"""
+    def run_extraction(self, content_types=None, resume=False):
+        """Run extraction for specified content types, optionally resuming an interrupted run"""
         if content_types is None:
             content_types = list(self.config['course_types'].keys())
 
@@ -531,7 +1367,7 @@ class UniversalGenesysExtractor:
         try:
             for content_type in content_types:
                 if content_type in self.config['course_types']:
-                    results = self.extract_content_type(content_type)
+                    results = self.extract_content_type(content_type, resume=resume)
                     all_results[content_type] = results
                 else:
                     print(f"Warning: Unknown content type '{content_type}'")
@@ -540,9 +1376,13 @@ class UniversalGenesysExtractor:
             self.create_combined_dataset(all_results)
 
         finally:
-            if self.driver:
-                self.driver.quit()
+            if self.close_drivers():
                 print("\nBrowser closed.")
+            if self.http_fetcher:
+                self.http_fetcher.close()
+                self.http_fetcher = None
+            self.close_parse_pool()
+            self.close_result_store()
 
         print(f"\n🎉 Extraction complete for all content types!")
         return all_results
@@ -0,0 +1,164 @@
+"""
+Capture of the JSON API responses a course page fetches while rendering
+"""
+
+import base64
+import html
+import json
+import re
+
+# Candidate payload keys for each LearningContent field, in priority order
+DEFAULT_FIELD_MAP = {
+    'description': ['description', 'longDescription', 'summary', 'overview', 'abstract'],
+    'course_outline': ['outline', 'courseOutline', 'modules', 'lessons', 'topics', 'objectives'],
+    'target_audience': ['targetAudience', 'audience', 'audiences', 'intendedAudience', 'roles'],
+    'duration': ['duration', 'durationMinutes', 'estimatedDuration', 'length', 'time']
+}
+
+TITLE_KEYS = ['title', 'name', 'courseTitle', 'displayName']
+SLUG_KEYS = ['slug', 'urlSlug', 'path', 'url']
+
+
+def enable_performance_logging(chrome_options):
+    """Ask ChromeDriver to record Network events in the performance log"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def drain_performance_log(driver):
+    """Discard buffered performance entries so only the next page is captured"""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def collect_json_responses(driver, url_patterns=None):
+    """Return (url, payload) for every JSON response logged since the last drain"""
+    url_patterns = url_patterns or []
+    responses = {}
+    finished = set()
+
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+
+        method = message.get('method')
+        params = message.get('params', {})
+
+        if method == 'Network.responseReceived':
+            response = params.get('response', {})
+            url = response.get('url', '')
+            if 'json' not in response.get('mimeType', ''):
+                continue
+            if url_patterns and not any(pattern in url for pattern in url_patterns):
+                continue
+            responses[params['requestId']] = url
+        elif method == 'Network.loadingFinished':
+            finished.add(params.get('requestId'))
+
+    payloads = []
+    for request_id, url in responses.items():
+        if request_id not in finished:
+            continue
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            text = body.get('body', '')
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8', errors='replace')
+            payloads.append((url, json.loads(text)))
+        except Exception:
+            # Body evicted from the buffer or not valid JSON
+            continue
+
+    return payloads
+
+
+def iter_records(payload):
+    """Yield every dict nested anywhere in a JSON payload"""
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            yield value
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def slug_matches(value, slug):
+    """Whether a slug or URL value names this course's slug as a whole path segment"""
+    value = value.rstrip('/').lower()
+    return value == slug or value.endswith('/' + slug)
+
+
+def find_course_record(payloads, course_data, field_map=None):
+    """Pick the payload record describing this course, or None if no record names it"""
+    field_map = field_map or DEFAULT_FIELD_MAP
+    title = course_data['title'].strip().lower()
+    slug = course_data['url'].rstrip('/').rsplit('/', 1)[-1].lower()
+    description_keys = field_map.get('description', [])
+
+    fallback = None
+    for url, payload in payloads:
+        described = []
+        for record in iter_records(payload):
+            for key in TITLE_KEYS:
+                value = record.get(key)
+                if isinstance(value, str) and value.strip().lower() == title:
+                    return record
+            for key in SLUG_KEYS:
+                value = record.get(key)
+                if isinstance(value, str) and slug_matches(value, slug):
+                    return record
+            if any(isinstance(record.get(key), str) for key in description_keys):
+                described.append(record)
+
+        # A response fetched from the course's own endpoint holding a single described record
+        path_segments = url.split('?', 1)[0].rstrip('/').lower().split('/')
+        if fallback is None and slug in path_segments and len(described) == 1:
+            fallback = described[0]
+
+    return fallback
+
+
+def clean_text(value):
+    """Strip markup and collapse whitespace in a payload string"""
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', value))
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def text_items(value):
+    """Flatten a payload list of strings or {title/name} objects into strings"""
+    if isinstance(value, str):
+        return [clean_text(value)] if value.strip() else []
+
+    items = []
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                item = next((item[key] for key in TITLE_KEYS if isinstance(item.get(key), str)), '')
+            if isinstance(item, str) and item.strip():
+                items.append(clean_text(item))
+    return items
+
+
+def fields_from_record(record, field_map=None):
+    """Map a course record onto raw LearningContent field values"""
+    field_map = field_map or DEFAULT_FIELD_MAP
+    fields = {}
+
+    for field, keys in field_map.items():
+        value = next((record[key] for key in keys if record.get(key) not in (None, '', [])), None)
+        if value is None:
+            continue
+
+        if field in ('course_outline', 'target_audience'):
+            fields[field] = text_items(value)
+        elif isinstance(value, (int, float)):
+            fields[field] = str(value)
+        elif isinstance(value, str):
+            fields[field] = clean_text(value)
+
+    return fields
@@ -0,0 +1,77 @@
+"""
+Asyncio HTTP engine for bulk URL validation and page fetching
+"""
+
+import asyncio
+import time
+import aiohttp
+
+from utils.fetchers import DEFAULT_HEADERS
+
+
+class AsyncFetcher:
+    """Concurrent HTTP client with bounded concurrency and per-host connection limits"""
+
+    def __init__(self, concurrency=64, per_host=16, timeout=10, headers=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.headers = headers or DEFAULT_HEADERS
+
+    def _session(self):
+        """Create one client session so connections are reused across requests"""
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def _check(self, session, semaphore, url):
+        """HEAD a URL, retrying with GET when the server rejects HEAD"""
+        async with semaphore:
+            try:
+                async with session.head(url, allow_redirects=True) as response:
+                    status = response.status
+                if status in (403, 405, 501):
+                    async with session.get(url, allow_redirects=True) as response:
+                        status = response.status
+                return url, {'status': status, 'ok': status < 400, 'error': ''}
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return url, {'status': None, 'ok': False, 'error': str(e) or type(e).__name__}
+
+    async def _get(self, session, semaphore, url):
+        """GET a page body with its timing"""
+        async with semaphore:
+            start_time = time.time()
+            try:
+                async with session.get(url, allow_redirects=True) as response:
+                    text = await response.text()
+                    return url, {
+                        'status': response.status,
+                        'page_source': text if response.status < 400 else None,
+                        'elapsed': time.time() - start_time,
+                        'error': '' if response.status < 400 else f"HTTP {response.status}"
+                    }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return url, {
+                    'status': None,
+                    'page_source': None,
+                    'elapsed': time.time() - start_time,
+                    'error': str(e) or type(e).__name__
+                }
+
+    async def _run(self, worker, urls):
+        """Run one coroutine per unique URL and collect the results"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._session() as session:
+            tasks = [worker(session, semaphore, url) for url in dict.fromkeys(urls)]
+            return dict(await asyncio.gather(*tasks))
+
+    def validate_urls(self, urls):
+        """Check many URLs at once, returning {url: {'status', 'ok', 'error'}}"""
+        return asyncio.run(self._run(self._check, urls))
+
+    def fetch_pages(self, urls):
+        """Fetch many pages at once, returning {url: {'status', 'page_source', 'elapsed', 'error'}}"""
+        return asyncio.run(self._run(self._get, urls))
@@ -0,0 +1,110 @@
+"""
+Aho-Corasick matcher for audience terms
+
+All taxonomy terms are compiled once into a deterministic automaton over
+words, so a text is scanned in a single pass however many terms there are.
+Running over word tokens gives word-boundary semantics for free ("admin" never
+fires inside "administrators"), and overlapping matches resolve to the longest
+term ("contact center agents" wins over "agents").
+"""
+
+import re
+from collections import deque
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def taxonomy_from_terms(term_map):
+    """Convert a {term: standard name} table into a {standard name: [terms]} taxonomy"""
+    taxonomy = {}
+    for term, standard_name in term_map.items():
+        taxonomy.setdefault(standard_name, []).append(term)
+    return taxonomy
+
+
+class AudienceMatcher:
+    """Finds standardized audience names in text using a taxonomy of {standard name: [terms]}
+
+    Lower-case terms match case-insensitively; terms written with capitals
+    (such as "IT") must match exactly, which keeps the pronoun "it" out.
+    """
+
+    def __init__(self, taxonomy):
+        self.names = list(taxonomy)
+        self.terms = []  # (words, standard name, case sensitive)
+        for standard_name, terms in taxonomy.items():
+            for term in terms:
+                words = WORD_PATTERN.findall(term)
+                if words:
+                    self.terms.append((words, standard_name, term != term.lower()))
+
+        self._build()
+
+    def _build(self):
+        """Build the word trie, failure links and the full transition table"""
+        goto = [{}]
+        outputs = [[]]
+        for term_index, (words, _, _) in enumerate(self.terms):
+            state = 0
+            for word in words:
+                word = word.lower()
+                if word not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][word] = len(goto) - 1
+                state = goto[state][word]
+            outputs[state].append(term_index)
+
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        order = deque(goto[0].values())
+        while order:
+            state = order.popleft()
+            # Failure targets are shallower, so their transitions are already complete
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for word, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(word, 0)
+                order.append(child)
+
+        self.delta = delta
+        self.outputs = outputs
+        self.lengths = [len(words) for words, _, _ in self.terms]
+
+    def matches(self, text):
+        """Non-overlapping (first word, end word, standard name) matches, leftmost-longest first"""
+        words = WORD_PATTERN.findall(text.lower())
+        original = None
+
+        candidates = []
+        delta, outputs, lengths = self.delta, self.outputs, self.lengths
+        state = 0
+        for end, word in enumerate(words, 1):
+            state = delta[state].get(word, 0)
+            if not outputs[state]:
+                continue
+
+            for term_index in outputs[state]:
+                start = end - lengths[term_index]
+                term_words, _, case_sensitive = self.terms[term_index]
+                if case_sensitive:
+                    original = original or WORD_PATTERN.findall(text)
+                    if len(original) != len(words) or original[start:end] != term_words:
+                        continue
+                candidates.append((start, -lengths[term_index], term_index))
+
+        found = []
+        position = 0
+        for start, negative_length, term_index in sorted(candidates):
+            if start < position:
+                continue
+            position = start - negative_length
+            found.append((start, position, self.terms[term_index][1]))
+        return found
+
+    def find(self, text):
+        """Standard audience names mentioned in text, in taxonomy order"""
+        mentioned = {standard_name for _, _, standard_name in self.matches(text)}
+        return [standard_name for standard_name in self.names if standard_name in mentioned]
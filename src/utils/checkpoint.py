@@ -0,0 +1,116 @@
+"""
+Append-only JSONL checkpoint of finished extraction results
+"""
+
+import json
+import os
+
+
+class CheckpointLog:
+    """Appends one JSON line per finished item, flushed as soon as it is written"""
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        self.file = None
+
+    def open(self, truncate=False):
+        """Open the log for appending, optionally starting it over"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not truncate:
+            self.drop_torn_tail()
+        self.file = open(self.path, 'w' if truncate else 'a', encoding='utf-8')
+        return self
+
+    def drop_torn_tail(self):
+        """Cut a partially written last line so the next append starts on a fresh line"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb+') as f:
+            content = f.read()
+            if content and not content.endswith(b'\n'):
+                f.truncate(content.rfind(b'\n') + 1)
+
+    def append(self, record):
+        """Write one result dict as a line and push it to disk"""
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        """Close the log file"""
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self.open() if self.file is None else self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def read_checkpoint(path):
+    """Yield result dicts from a checkpoint, skipping a torn last line"""
+    if not os.path.exists(path):
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def load_checkpoint(path):
+    """Latest result dict per URL from a checkpoint"""
+    return {record['url']: record for record in read_checkpoint(path)}
+
+
+def index_checkpoint(path):
+    """Byte offset of the latest line for each URL in a checkpoint"""
+    offsets = {}
+    if not os.path.exists(path):
+        return offsets
+
+    with open(path, 'rb') as f:
+        offset = 0
+        for line in f:
+            try:
+                offsets[json.loads(line)['url']] = offset
+            except (ValueError, KeyError):
+                pass
+            offset += len(line)
+    return offsets
+
+
+class CheckpointResults:
+    """Latest checkpointed record per URL in course-list order, read back from disk on every iteration
+
+    Only one byte offset per URL is kept in memory. URLs missing from the
+    course list follow in checkpoint order.
+    """
+
+    def __init__(self, path, urls, factory=None):
+        self.path = path
+        self.factory = factory
+        offsets = index_checkpoint(path)
+        listed = dict.fromkeys(urls)
+        self.offsets = [offsets[url] for url in listed if url in offsets]
+        self.offsets += [offset for url, offset in offsets.items() if url not in listed]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        with open(self.path, 'rb') as f:
+            for offset in self.offsets:
+                f.seek(offset)
+                record = json.loads(f.readline())
+                yield self.factory(record) if self.factory else record
@@ -0,0 +1,78 @@
+"""
+Adaptive concurrency control for the extraction worker pool
+"""
+
+import threading
+
+
+class AimdController:
+    """Additive-increase / multiplicative-decrease limit on in-flight pages
+
+    Completions are judged in rounds of roughly one limit's worth of pages
+    (the analogue of a TCP round trip). A clean round raises the limit by
+    `increase`; a round with too many errors or slow pages, or any soft-block
+    signal, multiplies it by `decrease_factor`.
+    """
+
+    def __init__(self, initial=2, minimum=1, maximum=8, increase=1, decrease_factor=0.5,
+                 latency_target=None, error_threshold=0.2):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._lock = threading.Lock()
+        self._reset_round()
+
+    def _reset_round(self):
+        self._round_size = max(1, int(self._limit))
+        self._samples = 0
+        self._errors = 0
+        self._slow = 0
+
+    @property
+    def limit(self):
+        """Current number of pages allowed in flight"""
+        return int(self._limit)
+
+    def _decrease(self, reason):
+        old_limit = self.limit
+        self._limit = max(float(self.minimum), self._limit * self.decrease_factor)
+        self._reset_round()
+        if self.limit != old_limit:
+            print(f"  Concurrency {old_limit} -> {self.limit} ({reason})")
+
+    def _increase(self):
+        old_limit = self.limit
+        self._limit = min(float(self.maximum), self._limit + self.increase)
+        self._reset_round()
+        if self.limit != old_limit:
+            print(f"  Concurrency {old_limit} -> {self.limit}")
+
+    def record(self, latency, error=False, blocked=False):
+        """Feed one completed page into the controller"""
+        with self._lock:
+            # Throttling from the site backs off immediately, like a TCP loss
+            if blocked:
+                self._decrease("soft block detected")
+                return
+
+            self._samples += 1
+            self._errors += 1 if error else 0
+            if self.latency_target and latency > self.latency_target:
+                self._slow += 1
+
+            if self._samples < self._round_size:
+                return
+
+            error_rate = self._errors / self._samples
+            slow_rate = self._slow / self._samples
+            if error_rate > self.error_threshold:
+                self._decrease(f"error rate {error_rate:.0%}")
+            elif slow_rate > 0.5:
+                self._decrease(f"latency above {self.latency_target}s")
+            else:
+                self._increase()
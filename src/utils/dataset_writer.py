@@ -0,0 +1,130 @@
+"""
+Streaming writers for the per-type and combined learning-content datasets
+
+Items are written to the JSON, CSV and (optionally) Parquet outputs as they
+arrive, and the summary counts are kept along the way, so writing a dataset
+holds one item at a time whatever the size of the catalog. The JSON document
+lists "items" first; the info and statistics blocks, which depend on every
+item, are written after it. Each file is written to a temporary name and
+moved into place once complete.
+"""
+
+import csv
+import json
+import os
+
+from utils.parquet_export import ParquetStreamWriter, parquet_available
+
+CSV_HEADER = [
+    'title', 'url', 'content_type', 'description', 'learning_type',
+    'duration', 'duration_minutes', 'course_outline', 'target_audience'
+]
+
+ITEM_FIELDS = [
+    'title', 'url', 'content_type', 'description', 'learning_type', 'duration', 'duration_minutes',
+    'course_outline', 'target_audience', 'extraction_timestamp', 'time_to_ready', 'extraction_status'
+]
+
+
+def item_record(data):
+    """Output item dict, in output field order, from a result dict"""
+    return {field: data.get(field) for field in ITEM_FIELDS}
+
+
+def csv_row(item):
+    """CSV row for an output item, with list fields joined by ' | '"""
+    return [
+        item['title'],
+        item['url'],
+        item['content_type'],
+        item['description'],
+        item['learning_type'],
+        item['duration'],
+        '' if item['duration_minutes'] is None else item['duration_minutes'],
+        ' | '.join(item['course_outline']) if item['course_outline'] else '',
+        ' | '.join(item['target_audience']) if item['target_audience'] else ''
+    ]
+
+
+class DatasetWriter:
+    """Writes items to JSON, CSV and, when a path is given and pyarrow is installed, Parquet in one pass"""
+
+    def __init__(self, json_path, csv_path, parquet_path=None):
+        self.paths = [json_path, csv_path]
+        self.parquet_writer = None
+        if parquet_path and parquet_available():
+            self.paths.append(parquet_path)
+            self.parquet_writer = ParquetStreamWriter(parquet_path + '.tmp')
+
+        self.json_file = open(json_path + '.tmp', 'w', encoding='utf-8')
+        self.csv_file = open(csv_path + '.tmp', 'w', newline='', encoding='utf-8')
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(CSV_HEADER)
+        self.json_file.write('{\n  "items": [')
+
+        self.total_items = 0
+        self.by_content_type = {}
+        self.with_target_audience = 0
+        self.with_descriptions = 0
+        self.successful = 0
+
+    def write(self, item):
+        """Write one output item to every file and count it"""
+        separator = ',\n    ' if self.total_items else '\n    '
+        self.json_file.write(separator + json.dumps(item, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+        self.csv_writer.writerow(csv_row(item))
+        if self.parquet_writer:
+            self.parquet_writer.write(item)
+
+        self.total_items += 1
+        content_type = item['content_type']
+        self.by_content_type[content_type] = self.by_content_type.get(content_type, 0) + 1
+        if item['target_audience']:
+            self.with_target_audience += 1
+        if item['description']:
+            self.with_descriptions += 1
+        if item['description'] or item['target_audience']:
+            self.successful += 1
+
+    def statistics(self):
+        """Statistics block for the items written so far"""
+        return {
+            'by_content_type': dict(self.by_content_type),
+            'with_target_audience': self.with_target_audience,
+            'with_descriptions': self.with_descriptions
+        }
+
+    def close(self, summary):
+        """Finish every file, appending the summary blocks to the JSON, then move them into place"""
+        tail = json.dumps(summary, indent=2, ensure_ascii=False)[1:]
+        self.json_file.write(('\n  ],' if self.total_items else '],') + tail + '\n')
+        self.json_file.close()
+        self.csv_file.close()
+        if self.parquet_writer:
+            self.parquet_writer.close()
+
+        for path in self.paths:
+            os.replace(path + '.tmp', path)
+        return summary
+
+    def abort(self):
+        """Close and delete the unfinished files"""
+        self.json_file.close()
+        self.csv_file.close()
+        if self.parquet_writer:
+            self.parquet_writer.writer.close()
+        for path in self.paths:
+            if os.path.exists(path + '.tmp'):
+                os.remove(path + '.tmp')
+
+
+class CombinedDatasetWriter(DatasetWriter):
+    """Writer for the combined dataset, closed with its dataset_info and statistics blocks"""
+
+    def close(self, dataset_info):
+        """Finish every file with the dataset info and statistics, then move them into place"""
+        return super().close({
+            'dataset_info': dict(dataset_info, total_items=self.total_items,
+                                 content_types=list(self.by_content_type)),
+            'statistics': self.statistics()
+        })
@@ -0,0 +1,168 @@
+"""
+WebDriver pool for running several Chrome workers in parallel
+"""
+
+import threading
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is skipped without psutil
+    psutil = None
+
+
+_psutil_warning_shown = False
+
+
+def warn_missing_psutil():
+    """Say once that max_rss_mb has no effect without psutil"""
+    global _psutil_warning_shown
+    if not _psutil_warning_shown:
+        _psutil_warning_shown = True
+        print("Warning: driver_recycling.max_rss_mb is set but psutil is not installed; "
+              "memory-based browser recycling is disabled (pip install psutil)")
+
+
+def driver_rss_mb(driver):
+    """Resident memory of chromedriver and all Chrome processes it started, in MB"""
+    if psutil is None:
+        return None
+
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        total = 0
+        for child in processes:
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except (AttributeError, psutil.Error):
+        return None
+
+
+class DriverPool:
+    """Thread-safe pool of lazily created WebDriver instances"""
+
+    def __init__(self, driver_factory, size=1, max_pages=None, max_rss_mb=None, recycle_on_error=True):
+        """Initialize with a callable returning a new driver (or None on failure)"""
+        self.driver_factory = driver_factory
+        self.size = max(1, int(size))
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        if max_rss_mb and psutil is None:
+            warn_missing_psutil()
+        self.recycle_on_error = recycle_on_error
+        self._idle = []
+        self._drivers = []
+        self._pages = {}
+        self._starting = 0
+        self._lock = threading.Lock()
+        # Signalled whenever a driver is handed back or a slot is freed
+        self._available = threading.Condition(self._lock)
+        self.recycled = 0
+
+    def acquire(self):
+        """Get an idle driver, starting a new one while the pool is not full"""
+        with self._available:
+            # Pool is full - wait for another worker to hand its driver back or retire it
+            while not self._idle and len(self._drivers) + self._starting >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._starting += 1
+
+        driver = None
+        try:
+            driver = self.driver_factory()
+        finally:
+            with self._available:
+                self._starting -= 1
+                if driver is not None:
+                    self._drivers.append(driver)
+                    self._pages[id(driver)] = 0
+                else:
+                    self._available.notify()
+
+        if driver is None:
+            raise RuntimeError("Chrome driver setup failed")
+        return driver
+
+    def record_pages(self, driver, count=1):
+        """Count pages loaded by a driver towards its recycling limit"""
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + count
+
+    def pages_left(self, driver):
+        """Pages a driver may still load before it is recycled (None when unlimited)"""
+        if not self.max_pages:
+            return None
+        return max(0, self.max_pages - self._pages.get(id(driver), 0))
+
+    def recycle_reason(self, driver):
+        """Why a driver should be restarted, or None to keep it"""
+        if self.max_pages and self._pages.get(id(driver), 0) >= self.max_pages:
+            return f"{self._pages[id(driver)]} pages loaded"
+
+        if self.max_rss_mb:
+            rss = driver_rss_mb(driver)
+            if rss is not None and rss > self.max_rss_mb:
+                return f"memory at {rss:.0f} MB"
+
+        return None
+
+    def retire(self, driver, reason):
+        """Quit a driver and free its slot so the next acquire starts a fresh one"""
+        with self._available:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._pages.pop(id(driver), None)
+            self.recycled += 1
+            self._available.notify()
+
+        print(f"Recycling browser ({reason})")
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+
+    def release(self, driver, failed=False):
+        """Return a driver to the pool, recycling it if the policy says so"""
+        reason = "navigation error" if failed and self.recycle_on_error else self.recycle_reason(driver)
+        if reason:
+            self.retire(driver, reason)
+        else:
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+
+    @contextmanager
+    def lease(self):
+        """Context manager holding a driver for the duration of one task"""
+        driver = self.acquire()
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(driver, failed)
+
+    def close(self):
+        """Quit every driver started by the pool"""
+        with self._available:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._pages.clear()
+            self._idle.clear()
+            self._available.notify_all()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+
+        return len(drivers)
@@ -0,0 +1,78 @@
+"""
+Course duration parsing
+
+One compiled tokenizer finds every "<number> <unit>" token; an hours token
+directly followed by a minutes token ("1 hour 25 minutes", "1h 30m",
+"2 hrs and 15 mins") is summed into a single duration in minutes.
+"""
+
+import re
+
+DURATION_TOKEN = re.compile(
+    r'(?<![\w.])(\d+(?:\.\d+)?)'
+    r'(?:\s*(hours?|hrs?|minutes?|mins?)\b|(h|m)(?![a-z]))',
+    re.IGNORECASE
+)
+
+# What may separate two tokens of the same duration
+TOKEN_GAP = re.compile(r'[\s,]*(?:and|&)?\s*', re.IGNORECASE)
+
+BARE_NUMBER = re.compile(r'\s*(\d+(?:\.\d+)?)\s*')
+
+
+def unit_minutes(unit):
+    """Minutes per unit for a matched unit word"""
+    return 60 if unit.lower().startswith('h') else 1
+
+
+def format_duration(minutes):
+    """Display string such as "1 hr 25 mins" for a number of minutes"""
+    hours, mins = divmod(minutes, 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours} hr" + ("s" if hours != 1 else ""))
+    if mins or not hours:
+        parts.append(f"{mins} min" + ("s" if mins != 1 else ""))
+    return ' '.join(parts)
+
+
+def parse_duration(text, bare_unit=None):
+    """First duration in text as (display string, minutes), or ("", None)
+
+    bare_unit ("minutes" or "hours") is applied when the whole text is a bare
+    number, as in API payloads such as {"durationMinutes": 85}.
+    """
+    if not text:
+        return "", None
+
+    if bare_unit:
+        bare = BARE_NUMBER.fullmatch(text)
+        if bare:
+            minutes = round(float(bare.group(1)) * unit_minutes(bare_unit))
+            return format_duration(minutes), minutes
+
+    total = None
+    previous_scale = None
+    previous_end = None
+    for match in DURATION_TOKEN.finditer(text):
+        unit = match.group(2) or match.group(3)
+        scale = unit_minutes(unit)
+
+        # A lone "m" ("4.5m users") only means minutes right after an hours token
+        if total is None and match.group(3) and scale == 1:
+            continue
+
+        if total is not None:
+            # Only minutes directly following hours belong to the same duration
+            if scale >= previous_scale or not TOKEN_GAP.fullmatch(text, previous_end, match.start()):
+                break
+
+        total = (total or 0) + float(match.group(1)) * scale
+        previous_scale = scale
+        previous_end = match.end()
+
+    if total is None:
+        return "", None
+
+    minutes = round(total)
+    return format_duration(minutes), minutes
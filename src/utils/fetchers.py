@@ -0,0 +1,254 @@
+"""
+Page fetchers used by the extractor
+
+Every fetcher returns a FetchResult so extraction runs the same way against a
+live browser, plain HTTP, recorded snapshots or synthetic pages.
+"""
+
+import hashlib
+import json
+import os
+import time
+import requests
+from selenium.common.exceptions import TimeoutException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.page_readiness import collect_selectors, wait_for_ready, MARK_STALE_SCRIPT
+from utils.api_capture import drain_performance_log, collect_json_responses
+from utils.in_page_extraction import collect_page_fields
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+
+class FetchResult:
+    """Page source plus timing metadata for one fetched URL"""
+
+    def __init__(self, url, page_source=None, elapsed=0.0, time_to_ready=0.0, ready=True,
+                 status=None, backend='', api_payloads=None, page_fields=None, source_loader=None):
+        self.url = url
+        self.elapsed = elapsed
+        self.time_to_ready = time_to_ready
+        self.ready = ready
+        self.status = status
+        self.backend = backend
+        self.api_payloads = api_payloads
+        self.page_fields = page_fields
+        self._page_source = page_source
+        self._source_loader = source_loader
+
+    @property
+    def page_source(self):
+        """HTML of the page, loaded on first access when the fetcher deferred it"""
+        if self._page_source is None and self._source_loader:
+            self._page_source = self._source_loader()
+        return self._page_source or ''
+
+    def detach(self):
+        """Stop reading from the fetcher's browser; a source not loaded by now stays empty"""
+        self._source_loader = None
+
+
+class Fetcher:
+    """Base class for page sources"""
+
+    backend = 'base'
+
+    def fetch(self, url, content_config=None):
+        """Return a FetchResult for url; content_config is the course type's config block"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the fetcher"""
+        pass
+
+
+class SeleniumFetcher(Fetcher):
+    """Loads pages in a Chrome driver and waits for them to become ready"""
+
+    backend = 'selenium'
+
+    def __init__(self, driver, readiness=None):
+        self.driver = driver
+        self.readiness = readiness or {}
+
+    def fetch(self, url, content_config=None):
+        content_config = content_config or {}
+        extraction_settings = content_config.get('extraction_settings', {})
+        extraction_mode = extraction_settings.get('extraction_mode', 'dom')
+        api_capture = extraction_mode == 'api_capture'
+
+        if api_capture:
+            drain_performance_log(self.driver)
+        # With the "none" page load strategy get() returns before the old document is replaced
+        self.driver.execute_script(MARK_STALE_SCRIPT)
+
+        # wait_time bounds the whole fetch: the load (via the driver's page load timeout) plus rendering
+        wait_time = extraction_settings.get('wait_time', 10)
+        start_time = time.time()
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            # Still loading (slow third-party resources); work with what has rendered so far
+            self.driver.execute_script("window.stop();")
+
+        ready, _ = wait_for_ready(
+            self.driver,
+            collect_selectors(content_config.get('css_selectors')),
+            timeout=max(0.0, wait_time - (time.time() - start_time)),
+            quiet_period=self.readiness.get('quiet_period', 1.0),
+            poll_interval=self.readiness.get('poll_interval', 0.25)
+        )
+        # Measured from navigation start, as in tab mode
+        time_to_ready = time.time() - start_time
+
+        api_payloads = None
+        if api_capture:
+            capture_settings = extraction_settings.get('api_capture', {})
+            api_payloads = collect_json_responses(self.driver, capture_settings.get('url_patterns'))
+
+        page_fields = None
+        if extraction_mode == 'in_page':
+            page_fields = collect_page_fields(self.driver, content_config.get('css_selectors'))
+
+        # page_source is only transferred if extraction actually needs the HTML
+        driver = self.driver
+        return FetchResult(
+            url,
+            elapsed=time.time() - start_time,
+            time_to_ready=time_to_ready,
+            ready=ready,
+            backend=self.backend,
+            api_payloads=api_payloads,
+            page_fields=page_fields,
+            source_loader=lambda: driver.page_source
+        )
+
+
+class HttpFetcher(Fetcher):
+    """Fetches pages over plain HTTP with a pooled requests.Session"""
+
+    backend = 'http'
+
+    def __init__(self, pool_size=16, timeout=15, retries=2, headers=None):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        retry = Retry(total=retries, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=['GET', 'HEAD'],
+                      raise_on_status=False)  # raise_for_status then reports the final status
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def fetch(self, url, content_config=None):
+        """Fetch a page, raising on HTTP errors"""
+        start_time = time.time()
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        elapsed = time.time() - start_time
+        return FetchResult(url, response.text, elapsed=elapsed, time_to_ready=elapsed,
+                           status=response.status_code, backend=self.backend)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+
+class RecordedFetcher(Fetcher):
+    """Serves pages from snapshots saved by save_snapshot, for offline runs"""
+
+    backend = 'recorded'
+
+    def __init__(self, snapshot_dir):
+        self.snapshot_dir = snapshot_dir
+
+    @staticmethod
+    def snapshot_path(snapshot_dir, url):
+        """Snapshot file name derived from the URL"""
+        slug = url.rstrip('/').rsplit('/', 1)[-1][:60]
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(snapshot_dir, f"{slug}-{digest}.html")
+
+    @staticmethod
+    def save_snapshot(snapshot_dir, url, page_source, time_to_ready=0.0):
+        """Record a page (and its timing) for later offline extraction"""
+        os.makedirs(snapshot_dir, exist_ok=True)
+        path = RecordedFetcher.snapshot_path(snapshot_dir, url)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(page_source)
+        with open(path + '.meta.json', 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'time_to_ready': time_to_ready}, f)
+        return path
+
+    def fetch(self, url, content_config=None):
+        start_time = time.time()
+        path = self.snapshot_path(self.snapshot_dir, url)
+        with open(path, 'r', encoding='utf-8') as f:
+            page_source = f.read()
+        return FetchResult(url, page_source, elapsed=time.time() - start_time,
+                           status=200, backend=self.backend)
+
+    def urls(self):
+        """URLs of every recorded snapshot"""
+        urls = []
+        for name in sorted(os.listdir(self.snapshot_dir)):
+            if name.endswith('.meta.json'):
+                with open(os.path.join(self.snapshot_dir, name), 'r', encoding='utf-8') as f:
+                    urls.append(json.load(f)['url'])
+        return urls
+
+
+FAKE_PAGE_TEMPLATE = """<html><head><title>{title}</title>
+<script>window.__APP_STATE__ = {{"page": "course"}};</script></head>
+<body><nav><a href="/explore">Explore</a><a href="/learn">Learn</a></nav>
+<div class="main-content"><h1>{title}</h1>
+<div class="course-description">{title} explores the concepts, configuration steps and
+best practices needed to work with this feature in Genesys Cloud.</div>
+<div class="course-meta"><span>Duration</span><span>{minutes} mins</span></div>
+<h2>Target Audience</h2><p>{audience}</p>
+<h2>Course Objectives</h2>
+<div class="course-outline">Understand the core concepts of {title}</div>
+<div class="course-outline">Configure and troubleshoot the feature</div>
+</div><footer>All rights reserved</footer></body></html>"""
+
+FAKE_AUDIENCES = [
+    'Administrators, Supervisors',
+    'Developers and System Administrators',
+    'Contact Center Agents, Business Users',
+    'Analysts, Managers'
+]
+
+
+class FakeFetcher(Fetcher):
+    """Returns synthetic (or supplied) pages with no I/O, for benchmarks and profiling"""
+
+    backend = 'fake'
+
+    def __init__(self, pages=None, latency=0.0):
+        self.pages = pages or {}
+        self.latency = latency
+
+    def fetch(self, url, content_config=None):
+        if self.latency:
+            time.sleep(self.latency)
+
+        page_source = self.pages.get(url)
+        if page_source is None:
+            slug = url.rstrip('/').rsplit('/', 1)[-1]
+            seed = int(hashlib.sha1(url.encode('utf-8')).hexdigest()[:8], 16)
+            page_source = FAKE_PAGE_TEMPLATE.format(
+                title=slug.replace('-', ' ').title(),
+                minutes=5 + seed % 80,
+                audience=FAKE_AUDIENCES[seed % len(FAKE_AUDIENCES)]
+            )
+
+        return FetchResult(url, page_source, elapsed=self.latency, time_to_ready=self.latency,
+                           status=200, backend=self.backend)
@@ -0,0 +1,83 @@
+"""
+Interchangeable HTML parser backends for extraction
+
+Every backend exposes the same two operations extraction needs: the page's
+visible text and the text of each element matching a CSS selector.
+BeautifulSoup runs on html.parser or lxml; selectolax (lexbor) is optional.
+"""
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax backend is unavailable without the package
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    lxml = None
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+# Tags whose contents BeautifulSoup leaves out of get_text()
+NON_TEXT_TAGS = ['script', 'style', 'template']
+
+
+class SoupDocument:
+    """BeautifulSoup document using the html.parser or lxml tree builder"""
+
+    def __init__(self, page_source, features='html.parser'):
+        self.soup = BeautifulSoup(page_source, features)
+
+    def text(self):
+        """Visible text of the whole page"""
+        return self.soup.get_text()
+
+    def select_texts(self, selector):
+        """Text of every element matching a CSS selector"""
+        return [element.get_text() for element in self.soup.select(selector)]
+
+
+class SelectolaxDocument:
+    """selectolax (lexbor) document with BeautifulSoup-compatible text output"""
+
+    def __init__(self, page_source):
+        self.tree = LexborHTMLParser(page_source)
+        self.tree.strip_tags(NON_TEXT_TAGS)
+
+    def text(self):
+        """Visible text of the whole page"""
+        return self.tree.root.text(deep=True) if self.tree.root else ''
+
+    def select_texts(self, selector):
+        """Text of every element matching a CSS selector"""
+        return [node.text(deep=True) for node in self.tree.css(selector)]
+
+
+def available_backends():
+    """Backends whose libraries are installed"""
+    available = {'html.parser': True, 'lxml': lxml is not None, 'selectolax': LexborHTMLParser is not None}
+    return [backend for backend in PARSER_BACKENDS if available[backend]]
+
+
+def resolve_backend(backend):
+    """Configured backend if installed, otherwise the fastest installed one after it"""
+    if backend not in PARSER_BACKENDS:
+        print(f"Warning: Unknown HTML parser '{backend}', using html.parser")
+        return 'html.parser'
+
+    available = available_backends()
+    if backend in available:
+        return backend
+
+    fallback = 'lxml' if 'lxml' in available else 'html.parser'
+    print(f"Warning: HTML parser '{backend}' is not installed, using {fallback}")
+    return fallback
+
+
+def parse_html(page_source, backend='html.parser'):
+    """Parse page_source with the given backend"""
+    if backend == 'selectolax':
+        return SelectolaxDocument(page_source)
+    return SoupDocument(page_source, backend)
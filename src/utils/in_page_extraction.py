@@ -0,0 +1,71 @@
+"""
+Extraction inside the browser page
+
+The configured CSS selectors and the page text are evaluated with
+execute_script, so only a small JSON result crosses the WebDriver wire
+instead of the serialized DOM.
+"""
+
+# Mirrors BeautifulSoup's get_text(): text content without script/style/template
+PAGE_FIELDS_SCRIPT = """
+var selectors = arguments[0];
+var skipped = 'script, style, template';
+
+function textOf(element) {
+    if (!element.querySelector(skipped)) {
+        return element.textContent;
+    }
+    var copy = element.cloneNode(true);
+    copy.querySelectorAll(skipped).forEach(function (node) { node.remove(); });
+    return copy.textContent;
+}
+
+var matches = {};
+selectors.forEach(function (selector) {
+    try {
+        matches[selector] = Array.prototype.map.call(document.querySelectorAll(selector), textOf);
+    } catch (e) {
+        matches[selector] = null;
+    }
+});
+
+return {text: textOf(document.documentElement), matches: matches};
+"""
+
+# css_selectors lists the extractor reads element text from
+FIELD_SELECTOR_KEYS = ('description', 'course_outline')
+
+
+def field_selectors(css_selectors):
+    """Selectors whose matches extraction needs, without duplicates"""
+    selectors = []
+    for key in FIELD_SELECTOR_KEYS:
+        for selector in (css_selectors or {}).get(key, []):
+            if selector not in selectors:
+                selectors.append(selector)
+    return selectors
+
+
+def collect_page_fields(driver, css_selectors):
+    """Run the selectors and text collection in the current page, returning the compact result"""
+    return driver.execute_script(PAGE_FIELDS_SCRIPT, field_selectors(css_selectors))
+
+
+class InPageDocument:
+    """Document interface (see utils.html_parsing) over the result of collect_page_fields"""
+
+    def __init__(self, page_fields):
+        self.page_fields = page_fields
+
+    def text(self):
+        """Visible text of the whole page"""
+        return self.page_fields.get('text') or ''
+
+    def select_texts(self, selector):
+        """Text of every element matching a CSS selector"""
+        matches = self.page_fields.get('matches', {})
+        if selector not in matches:
+            raise KeyError(f"Selector was not evaluated in the page: {selector}")
+        if matches[selector] is None:
+            raise ValueError(f"Invalid selector: {selector}")
+        return matches[selector]
@@ -0,0 +1,100 @@
+"""
+Readiness detection for JavaScript-rendered course pages
+"""
+
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# One round trip per poll: load state, element count, DOM mutation count and whether any
+# selector matched. A MutationObserver counts changes so polls never re-serialize the DOM.
+DOM_STATE_SCRIPT = """
+if (window.__extractorMutations === undefined && document.documentElement) {
+    window.__extractorMutations = 0;
+    new MutationObserver(function () {
+        window.__extractorMutations++;
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+}
+var selector = arguments[0];
+var found = true;
+if (selector) {
+    try {
+        found = document.querySelector(selector) !== null;
+    } catch (e) {
+        found = false;
+    }
+}
+return [
+    document.readyState,
+    document.getElementsByTagName('*').length,
+    window.__extractorMutations || 0,
+    found,
+    window.__extractorStale === true
+];
+"""
+
+# Marks the current document so a probe cannot mistake it for the next page
+MARK_STALE_SCRIPT = "window.__extractorStale = true;"
+
+
+def collect_selectors(css_selectors):
+    """Flatten the configured css_selectors lists into one selector group"""
+    selectors = []
+    for field_selectors in (css_selectors or {}).values():
+        for selector in field_selectors:
+            if selector not in selectors:
+                selectors.append(selector)
+    return ', '.join(selectors)
+
+
+class PageReadinessProbe:
+    """Callable probe that reports a page as ready once content exists and the DOM is stable"""
+
+    def __init__(self, selector="", quiet_period=1.0):
+        self.selector = selector
+        self.quiet_period = quiet_period
+        self.last_signature = None
+        self.stable_since = None
+
+    def reset(self):
+        """Forget the previous DOM observation (e.g. after a new navigation)"""
+        self.last_signature = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        """Take one non-blocking observation of the page"""
+        ready_state, element_count, mutations, found, stale = driver.execute_script(
+            DOM_STATE_SCRIPT, self.selector
+        )
+        now = time.time()
+
+        # Still looking at the previous document of a reused tab
+        if stale:
+            self.reset()
+            return False
+
+        signature = (element_count, mutations)
+        if signature != self.last_signature:
+            self.last_signature = signature
+            self.stable_since = now
+            return False
+
+        if ready_state != 'complete' or not found:
+            return False
+
+        return now - self.stable_since >= self.quiet_period
+
+
+def wait_for_ready(driver, selector="", timeout=10, quiet_period=1.0, poll_interval=0.25):
+    """Block until the page is ready or the timeout expires, returning (ready, elapsed)"""
+    start_time = time.time()
+    probe = PageReadinessProbe(selector, quiet_period)
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_interval,
+                      ignored_exceptions=(JavascriptException,)).until(probe)
+        ready = True
+    except TimeoutException:
+        ready = False
+
+    return ready, time.time() - start_time
@@ -0,0 +1,76 @@
+"""
+Single-pass segmentation of course page text into labeled sections
+
+One combined heading regex indexes every section heading on the page; each
+section runs from the end of its heading to the start of the next one, so
+field extractors only look at the few hundred characters that concern them.
+The heading alternatives are plain literals separated by whitespace, so the
+scan never backtracks over section bodies and stays linear in the page size.
+"""
+
+import re
+
+# (section label, heading pattern) in priority order; generic single words are
+# matched case-sensitively so ordinary prose does not start a new section
+SECTION_HEADINGS = [
+    ('target_audience', r'(?i:target\s+audience)'),
+    ('target_audience', r'(?i:intended\s+audience)'),
+    ('target_audience', r'(?i:who\s+should\s+attend)'),
+    ('target_audience', r'(?i:this\s+(?:course|elearning)\s+is\s+(?:intended\s+)?for)'),
+    ('target_audience', r'(?i:designed\s+for)'),
+    ('target_audience', r'(?i:suitable\s+for)'),
+    ('prerequisites', r'(?i:course\s+prerequisites)|Prerequisites|PREREQUISITES'),
+    ('objectives', r'(?i:course\s+objectives|learning\s+objectives)|Objectives|OBJECTIVES'),
+    ('outline', r'(?i:course\s+outline)|Outline|Agenda|OUTLINE|AGENDA'),
+    ('description', r'(?i:course\s+description|about\s+this\s+course)|Description|Overview|Introduction'
+                    r'|DESCRIPTION|OVERVIEW|INTRODUCTION'),
+    ('duration', r'(?i:estimated\s+time)|Duration|DURATION'),
+]
+
+# Headings start on a word boundary and may not run on into a lower-case letter
+# ("Overviews"); an upper-case one is allowed because page text joins a heading
+# directly to its section ("Target AudienceAdministrators")
+HEADING_PATTERN = re.compile('|'.join(
+    rf"(?P<h{priority}>\b(?:{pattern})(?![a-z]))" for priority, (_, pattern) in enumerate(SECTION_HEADINGS)
+))
+
+# Separators left between a heading and its section text
+SECTION_LEAD = ' \t\r\n:-'
+
+
+class PageSections:
+    """Sections of one page's text, looked up by label"""
+
+    def __init__(self, text, headings):
+        self.text = text
+        self.headings = headings
+
+    def sections(self, label, max_length=None):
+        """Texts of every section with this label, best heading first, then in page order
+
+        max_length bounds how much text after each heading is returned.
+        """
+        found = []
+        for index, (section_label, priority, start, end) in enumerate(self.headings):
+            if section_label != label:
+                continue
+            stop = self.headings[index + 1][2] if index + 1 < len(self.headings) else len(self.text)
+            if max_length is not None:
+                stop = min(stop, end + max_length)
+            found.append((priority, start, self.text[end:stop].strip(SECTION_LEAD)))
+
+        return [section for _, _, section in sorted(found)]
+
+    def first(self, label, default=''):
+        """Text of the best section with this label"""
+        sections = self.sections(label)
+        return sections[0] if sections else default
+
+
+def segment_page(text):
+    """Index the section headings in text with one regex pass"""
+    headings = []
+    for match in HEADING_PATTERN.finditer(text):
+        priority = int(match.lastgroup[1:])
+        headings.append((SECTION_HEADINGS[priority][0], priority, match.start(), match.end()))
+    return PageSections(text, headings)
@@ -0,0 +1,88 @@
+"""
+Columnar Parquet export of learning content
+
+course_outline and target_audience are written as list<string> columns rather
+than ' | '-joined strings, and content_type is dictionary-encoded, so readers
+get typed columns and can load only the columns they need. pyarrow is optional.
+"""
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is unavailable without the package
+    pa = None
+    pq = None
+
+ROW_GROUP_SIZE = 10000
+
+
+def parquet_available():
+    """Whether pyarrow is installed"""
+    return pa is not None
+
+
+def parquet_schema():
+    """Arrow schema of an exported item"""
+    return pa.schema([
+        ('title', pa.string()),
+        ('url', pa.string()),
+        ('content_type', pa.dictionary(pa.int32(), pa.string())),
+        ('description', pa.string()),
+        ('learning_type', pa.string()),
+        ('duration', pa.string()),
+        ('duration_minutes', pa.int32()),
+        ('course_outline', pa.list_(pa.string())),
+        ('target_audience', pa.list_(pa.string())),
+        ('extraction_timestamp', pa.string()),
+        ('time_to_ready', pa.float64()),
+        ('extraction_status', pa.string()),
+    ])
+
+
+def records_batch(schema, records):
+    """Record batch from a list of item dicts, taking each schema column from the dicts"""
+    return pa.RecordBatch.from_arrays(
+        [pa.array([record.get(field.name) for record in records], type=field.type) for field in schema],
+        schema=schema
+    )
+
+
+class ParquetStreamWriter:
+    """Writes item dicts to a Parquet file as they arrive, one row group per row_group_size items"""
+
+    def __init__(self, path, row_group_size=ROW_GROUP_SIZE, compression='zstd'):
+        self.schema = parquet_schema()
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        self.batch = []
+        self.rows = 0
+
+    def write(self, record):
+        """Buffer one item, flushing a row group when the buffer is full"""
+        self.batch.append(record)
+        if len(self.batch) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered items as a row group"""
+        if self.batch:
+            self.writer.write_batch(records_batch(self.schema, self.batch))
+            self.rows += len(self.batch)
+            self.batch = []
+
+    def close(self):
+        """Write the last row group and the file footer"""
+        if self.batch or not self.rows:
+            self.writer.write_batch(records_batch(self.schema, self.batch))
+            self.rows += len(self.batch)
+            self.batch = []
+        self.writer.close()
+        return self.rows
+
+
+def write_parquet(path, records, row_group_size=ROW_GROUP_SIZE, compression='zstd'):
+    """Write item dicts to a Parquet file one row group at a time; returns the number of rows"""
+    writer = ParquetStreamWriter(path, row_group_size, compression)
+    for record in records:
+        writer.write(record)
+    return writer.close()
@@ -0,0 +1,47 @@
+"""
+Process pool for the CPU-bound parse/extract stage
+
+Fetch threads hand rendered HTML to the pool and release their browser right
+away, so the next page is loading while this one is being parsed.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Extractor owned by each pool process, built once by init_parse_worker
+_extractor = None
+
+
+def init_parse_worker(config_file):
+    """Pool process initializer: load the config into a browserless extractor"""
+    global _extractor
+    # Imported here to avoid a circular import with the extractor module
+    from universal_genesys_extractor import UniversalGenesysExtractor
+
+    _extractor = UniversalGenesysExtractor(config_file)
+
+
+def parse_page(content_type, course_data, page_source):
+    """Run the HTML extraction for one page inside a pool process"""
+    return _extractor.extract_from_page_source(content_type, course_data, page_source)
+
+
+class ParsePool:
+    """Parses pages in worker processes; parse() blocks the calling fetch thread only"""
+
+    def __init__(self, config_file, workers=2):
+        self.workers = max(1, int(workers))
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_parse_worker,
+            initargs=(config_file,)
+        )
+
+    def parse(self, content_type, course_data, page_source):
+        """Extract a LearningContent from page_source in a pool process"""
+        return self.executor.submit(parse_page, content_type, course_data, page_source).result()
+
+    def close(self):
+        """Shut the worker processes down"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,145 @@
+"""
+SQLite store of extraction results, one row per course URL
+
+Results are upserted by URL in batched transactions, so re-extracting a course
+updates its row in place and several writers can share one database file in
+WAL mode without rewriting whole JSON/CSV dumps. Exports read back with a
+single indexed query.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    url TEXT PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    title TEXT NOT NULL,
+    description TEXT,
+    learning_type TEXT,
+    duration TEXT,
+    duration_minutes INTEGER,
+    course_outline TEXT,
+    target_audience TEXT,
+    extraction_timestamp TEXT,
+    page_length INTEGER,
+    time_to_ready REAL,
+    extraction_status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_content_type ON results (content_type, position);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (extraction_timestamp);
+"""
+
+COLUMNS = [
+    'url', 'content_type', 'position', 'title', 'description', 'learning_type', 'duration',
+    'duration_minutes', 'course_outline', 'target_audience', 'extraction_timestamp',
+    'page_length', 'time_to_ready', 'extraction_status'
+]
+
+# Stored as JSON text
+LIST_COLUMNS = ('course_outline', 'target_audience')
+
+UPSERT = (
+    f"INSERT INTO results ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    f"ON CONFLICT (url) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}" for column in COLUMNS if column != 'url')
+)
+
+
+class SqliteResultStore:
+    """Result rows keyed by URL in a SQLite database file"""
+
+    def __init__(self, db_path, batch_size=500):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        """Per-thread autocommit connection in WAL mode"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, records, start_position=0):
+        """Insert or update result dicts by URL, one transaction per batch; returns how many were written"""
+        conn = self._connect()
+        rows = []
+        written = 0
+        for position, record in enumerate(records, start_position):
+            rows.append(self._row(record, position))
+            if len(rows) >= self.batch_size:
+                written += self._write(conn, rows)
+                rows = []
+        if rows:
+            written += self._write(conn, rows)
+        return written
+
+    def _write(self, conn, rows):
+        """Write one batch of rows in a single transaction"""
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(UPSERT, rows)
+        except sqlite3.Error:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return len(rows)
+
+    def _row(self, record, position):
+        """Column values for one result dict"""
+        values = []
+        for column in COLUMNS:
+            value = position if column == 'position' else record.get(column)
+            if column in LIST_COLUMNS:
+                value = json.dumps(value or [], ensure_ascii=False)
+            values.append(value)
+        return values
+
+    def content_types(self):
+        """Content types with stored results"""
+        rows = self._connect().execute(
+            "SELECT DISTINCT content_type FROM results ORDER BY content_type"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def results(self, content_type=None):
+        """Stored result dicts, optionally for one content type, in input order"""
+        query = f"SELECT {', '.join(COLUMNS)} FROM results"
+        params = []
+        if content_type:
+            query += " WHERE content_type = ?"
+            params.append(content_type)
+        query += " ORDER BY content_type, position"
+
+        for row in self._connect().execute(query, params):
+            record = dict(zip(COLUMNS, row))
+            del record['position']
+            for column in LIST_COLUMNS:
+                record[column] = json.loads(record[column]) if record[column] else []
+            yield record
+
+    def counts(self):
+        """Number of stored results per content type"""
+        return dict(self._connect().execute(
+            "SELECT content_type, COUNT(*) FROM results GROUP BY content_type"
+        ).fetchall())
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,93 @@
+"""
+Delayed retries for failed extractions, with a dead-letter file for items that never succeed
+"""
+
+import heapq
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+
+class RetryScheduler:
+    """Holds failed items until their exponential backoff (with jitter) has elapsed
+
+    Nothing here sleeps: callers ask for items that are due and for how long
+    until the next one is, so the main loop keeps harvesting other pages.
+    """
+
+    def __init__(self, max_retries=3, base_delay=2.0, max_delay=60.0, dead_letter_file=None):
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.dead_letter_file = dead_letter_file
+        self.attempts = {}
+        self.dead_letters = 0
+
+        self._heap = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def backoff(self, attempt):
+        """Delay before retry number attempt: exponential, capped, with equal jitter"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def schedule(self, index, item, reason=''):
+        """Queue a failed item for a later attempt; False once its retries are used up"""
+        with self._lock:
+            attempt = self.attempts.get(index, 0) + 1
+            if attempt > self.max_retries:
+                self._dead_letter(item, attempt, reason)
+                return False
+
+            self.attempts[index] = attempt
+            delay = self.backoff(attempt)
+            heapq.heappush(self._heap, (time.time() + delay, next(self._counter), index, item))
+
+        print(f"  Retry {attempt}/{self.max_retries} for {item['title'][:60]} in {delay:.1f}s ({reason})")
+        return True
+
+    def pop_ready(self):
+        """Remove and return the (index, item) pairs whose backoff has elapsed"""
+        now = time.time()
+        ready = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, index, item = heapq.heappop(self._heap)
+                ready.append((index, item))
+        return ready
+
+    def next_delay(self):
+        """Seconds until the next retry is due, or None when nothing is waiting"""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.time())
+
+    def _dead_letter(self, item, attempts, reason):
+        self.dead_letters += 1
+        print(f"  Giving up on {item['title'][:60]} after {attempts} attempts ({reason})")
+        if not self.dead_letter_file:
+            return
+
+        directory = os.path.dirname(self.dead_letter_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        record = {
+            'title': item['title'],
+            'url': item['url'],
+            'attempts': attempts,
+            'reason': reason,
+            'failed_at': datetime.now().isoformat()
+        }
+        with open(self.dead_letter_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
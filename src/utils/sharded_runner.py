@@ -0,0 +1,198 @@
+"""
+Multi-process sharded extraction runner
+"""
+
+import json
+import multiprocessing
+import os
+import time
+
+
+def split_into_shards(courses, shard_count):
+    """Deal courses round-robin into shards of (input index, course) pairs"""
+    shards = [[] for _ in range(shard_count)]
+    for index, course_data in enumerate(courses):
+        shards[index % shard_count].append((index, course_data))
+    return [shard for shard in shards if shard]
+
+
+def shard_file_path(shard_dir, content_type, shard_index):
+    """Per-shard JSONL results file"""
+    return os.path.join(shard_dir, f"{content_type}_shard_{shard_index}.jsonl")
+
+
+def run_shard(config_file, content_type, shard, shard_file, extractor_options=None):
+    """Worker process entry point: extract one shard, appending each result as it finishes"""
+    # Imported here so the worker process builds its own extractor and driver
+    from universal_genesys_extractor import UniversalGenesysExtractor
+
+    extractor = UniversalGenesysExtractor(config_file, shard_count=1, **(extractor_options or {}))
+    indexes = [index for index, _ in shard]
+    courses = [course_data for _, course_data in shard]
+
+    with open(shard_file, 'a', encoding='utf-8') as f:
+        def write_record(record):
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+
+        def write_result(position, content):
+            record = content.to_dict()
+            record['index'] = indexes[position]
+            write_record(record)
+
+        # Courses that used up their retries are finished too, so the shard is not relaunched for them
+        def write_dead_letter(position, reason):
+            write_record({'index': indexes[position], 'dead_letter': reason})
+
+        try:
+            extractor.extract_courses(content_type, courses, on_complete=write_result,
+                                      on_dead_letter=write_dead_letter)
+        finally:
+            extractor.close_drivers()
+
+
+def read_shard_file(shard_file):
+    """Load {input index: result dict} from a shard file, skipping a torn last line
+
+    Dead-lettered courses appear as {'dead_letter': reason}.
+    """
+    records = {}
+    if not os.path.exists(shard_file):
+        return records
+
+    with open(shard_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record.pop('index')] = record
+    return records
+
+
+def leftover_shard_records(shard_dir, content_type):
+    """Result dicts left in shard files by an earlier run of this content type, dead letters excluded"""
+    if not os.path.isdir(shard_dir):
+        return
+
+    prefix = f"{content_type}_shard_"
+    for name in sorted(os.listdir(shard_dir)):
+        if name.startswith(prefix) and name.endswith('.jsonl'):
+            for record in read_shard_file(os.path.join(shard_dir, name)).values():
+                if 'dead_letter' not in record:
+                    yield record
+
+
+class ShardTail:
+    """Reads the complete lines appended to a shard file since the last read"""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+
+    def read_new(self):
+        """Records from newly completed lines; a line still being written is left for the next read"""
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        self.offset += end
+
+        records = []
+        for line in data[:end].splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+
+def run_shards(config_file, content_type, courses, shard_count, shard_dir='data/output/shards',
+               retries=1, extractor_options=None, on_result=None, poll_interval=1.0):
+    """Run every shard in its own process, reporting each finished course as soon as its shard writes it
+
+    on_result(input index, result dict) is called from this process while the
+    shards run. Returns (finished input indexes, failed shard indexes, input
+    indexes of dead-lettered courses).
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    context = multiprocessing.get_context('spawn')
+    shards = split_into_shards(courses, shard_count)
+    finished = set()
+    dead_letters = set()
+
+    # Leftovers of an earlier run are read by the caller before it starts a new one
+    for shard_index, shard in enumerate(shards):
+        shard_file = shard_file_path(shard_dir, content_type, shard_index)
+        if os.path.exists(shard_file):
+            os.remove(shard_file)
+
+    tails = {
+        shard_index: ShardTail(shard_file_path(shard_dir, content_type, shard_index))
+        for shard_index in range(len(shards))
+    }
+
+    def collect(shard_index):
+        for record in tails[shard_index].read_new():
+            index = record.pop('index')
+            if 'dead_letter' in record:
+                dead_letters.add(index)
+            elif index not in finished:
+                finished.add(index)
+                if on_result:
+                    on_result(index, record)
+
+    print(f"Running {len(shards)} extraction shards in separate processes")
+    pending = list(enumerate(shards))
+
+    for attempt in range(retries + 1):
+        processes = []
+        for shard_index, shard in pending:
+            shard_file = shard_file_path(shard_dir, content_type, shard_index)
+            process = context.Process(
+                target=run_shard,
+                args=(config_file, content_type, shard, shard_file, extractor_options),
+                name=f"{content_type}-shard-{shard_index}"
+            )
+            process.start()
+            processes.append((shard_index, shard, process))
+
+        # Pick up finished courses while the shards are still running
+        while any(process.is_alive() for _, _, process in processes):
+            for shard_index, _, _ in processes:
+                collect(shard_index)
+            time.sleep(poll_interval)
+
+        retry = []
+        for shard_index, shard, process in processes:
+            process.join()
+            collect(shard_index)
+
+            # Only the courses this shard never finished are retried
+            remaining = [(index, course_data) for index, course_data in shard
+                         if index not in finished and index not in dead_letters]
+            if process.exitcode != 0 or remaining:
+                print(f"Shard {shard_index} exited with code {process.exitcode}, "
+                      f"{len(remaining)} courses unfinished")
+            if remaining:
+                retry.append((shard_index, remaining))
+
+        pending = retry
+        if not pending:
+            break
+        if attempt < retries:
+            print(f"Retrying {len(pending)} failed shards")
+
+    failed_shards = [shard_index for shard_index, _ in pending]
+
+    # Shard files are only kept when something is still missing
+    if not failed_shards:
+        for shard_index in range(len(shards)):
+            shard_file = shard_file_path(shard_dir, content_type, shard_index)
+            if os.path.exists(shard_file):
+                os.remove(shard_file)
+
+    return finished, failed_shards, dead_letters
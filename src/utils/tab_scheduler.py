@@ -0,0 +1,127 @@
+"""
+Concurrent page loading across several tabs of one Chrome instance
+"""
+
+import queue
+import time
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from utils.page_readiness import PageReadinessProbe, MARK_STALE_SCRIPT
+
+
+class TabScheduler:
+    """Keeps K tabs of one driver loading pages and harvests whichever becomes ready first"""
+
+    def __init__(self, driver, tab_count, selector="", timeout=10, quiet_period=1.0, poll_interval=0.25):
+        self.driver = driver
+        self.tab_count = max(1, int(tab_count))
+        self.selector = selector
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+
+    def open_tabs(self):
+        """Open extra tabs up to tab_count, returning all window handles"""
+        handles = list(self.driver.window_handles)
+        self.driver.switch_to.window(handles[0])
+        while len(handles) < self.tab_count:
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        return handles[:self.tab_count]
+
+    def close_tabs(self, handles):
+        """Close every tab except the first one"""
+        try:
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+        except WebDriverException:
+            # Driver already gone; it will be recycled by the pool
+            pass
+
+    def start(self, tab, work_queue, budget):
+        """Begin loading the next queued item in a tab; False when the queue or budget is exhausted"""
+        if budget is not None and budget['started'] >= budget['limit']:
+            tab['item'] = None
+            return False
+
+        try:
+            tab['index'], tab['item'] = work_queue.get_nowait()
+        except queue.Empty:
+            tab['item'] = None
+            return False
+
+        if budget is not None:
+            budget['started'] += 1
+
+        try:
+            self.driver.switch_to.window(tab['handle'])
+            self.driver.execute_script(MARK_STALE_SCRIPT)
+            # Returns immediately when the driver uses the "none" page load strategy
+            self.driver.get(tab['item']['url'])
+        except WebDriverException:
+            work_queue.put((tab['index'], tab['item']))
+            tab['item'] = None
+            raise
+
+        tab['probe'].reset()
+        tab['started'] = time.time()
+        return True
+
+    def run(self, work_queue, harvest, on_result, max_items=None):
+        """Drain work_queue of (index, item); harvest(driver, item, ready, elapsed) runs on ready tabs
+
+        At most max_items pages are loaded; returns the number harvested.
+        """
+        budget = None if max_items is None else {'started': 0, 'limit': max_items}
+        handles = self.open_tabs()
+        tabs = [
+            {'handle': handle, 'item': None, 'index': None, 'started': 0.0,
+             'probe': PageReadinessProbe(self.selector, self.quiet_period)}
+            for handle in handles
+        ]
+        harvested_count = 0
+        active = []
+
+        try:
+            for tab in tabs:
+                if self.start(tab, work_queue, budget):
+                    active.append(tab)
+
+            while active:
+                harvested = False
+
+                # Round-robin over loading tabs, harvesting any that are ready
+                for tab in list(active):
+                    self.driver.switch_to.window(tab['handle'])
+                    try:
+                        ready = tab['probe'](self.driver)
+                    except JavascriptException:
+                        ready = False
+
+                    elapsed = time.time() - tab['started']
+                    if not ready and elapsed < self.timeout:
+                        continue
+
+                    content = harvest(self.driver, tab['item'], ready, elapsed)
+                    tab['item'] = None
+                    on_result(tab['index'], content)
+                    harvested = True
+                    harvested_count += 1
+
+                    if not self.start(tab, work_queue, budget):
+                        active.remove(tab)
+
+                if not harvested:
+                    time.sleep(self.poll_interval)
+        except WebDriverException:
+            # Hand unfinished items back so another driver picks them up
+            for tab in tabs:
+                if tab['item'] is not None:
+                    work_queue.put((tab['index'], tab['item']))
+            raise
+        finally:
+            self.close_tabs(handles)
+
+        return harvested_count
@@ -0,0 +1,224 @@
+"""
+SQLite-backed work queue for sharing one extraction run across several machines
+
+Items are claimed under a lease; workers extend their leases with heartbeats
+and a crashed worker's items become claimable again once its leases expire.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    UNIQUE (run_id, content_type, url)
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_claim ON work_items (run_id, status, lease_expires);
+"""
+
+
+def default_worker_id():
+    """Worker identity unique across hosts and processes"""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class SqliteWorkQueue:
+    """Lease-based work queue stored in a SQLite database file"""
+
+    def __init__(self, db_path, run_id='default', lease_seconds=120):
+        self.db_path = db_path
+        self.run_id = run_id
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        """Per-thread autocommit connection in WAL mode"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def connection(self):
+        """Transaction context manager that commits or rolls back"""
+        return _Transaction(self._connect())
+
+    def enqueue(self, content_type, courses):
+        """Add courses to the run, skipping ones already queued; returns how many were added"""
+        now = time.time()
+        with self.connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO work_items (run_id, content_type, position, title, url, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(self.run_id, content_type, position, c['title'], c['url'], now)
+                 for position, c in enumerate(courses)]
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker_id, content_type=None, limit=1, max_attempts=None):
+        """Lease up to limit pending or expired items, returning them as dicts
+
+        An expired lease on an item that already had max_attempts attempts means
+        the item keeps killing its workers, so it is marked failed instead.
+        """
+        now = time.time()
+        query = (
+            "SELECT id, content_type, position, title, url, attempts FROM work_items "
+            "WHERE run_id = ? AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?))"
+        )
+        params = [self.run_id, now]
+        if content_type:
+            query += " AND content_type = ?"
+            params.append(content_type)
+        query += " ORDER BY content_type, position LIMIT ?"
+        params.append(limit)
+
+        with self.connection() as conn:
+            if max_attempts:
+                conn.execute(
+                    "UPDATE work_items SET status = 'failed', error = ?, lease_owner = NULL, "
+                    "lease_expires = NULL, updated_at = ? "
+                    "WHERE run_id = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (f"lease expired after {max_attempts} attempts", now, self.run_id, now, max_attempts)
+                )
+            rows = conn.execute(query, params).fetchall()
+            for row in rows:
+                conn.execute(
+                    "UPDATE work_items SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (worker_id, now + self.lease_seconds, now, row[0])
+                )
+
+        return [
+            {'id': row[0], 'content_type': row[1], 'position': row[2],
+             'title': row[3], 'url': row[4], 'attempts': row[5] + 1}
+            for row in rows
+        ]
+
+    def heartbeat(self, worker_id):
+        """Extend every lease held by a worker"""
+        now = time.time()
+        with self.connection() as conn:
+            conn.execute(
+                "UPDATE work_items SET lease_expires = ?, updated_at = ? "
+                "WHERE run_id = ? AND status = 'leased' AND lease_owner = ?",
+                (now + self.lease_seconds, now, self.run_id, worker_id)
+            )
+
+    def complete(self, item_id, worker_id, result):
+        """Store a finished item's result; ignored if the lease was lost to another worker"""
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = 'done', result = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND lease_owner = ?",
+                (json.dumps(result, ensure_ascii=False), time.time(), item_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, item_id, worker_id, error, max_attempts=3):
+        """Release a failed item for another attempt, or mark it failed for good"""
+        with self.connection() as conn:
+            conn.execute(
+                "UPDATE work_items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ?",
+                (max_attempts, str(error), time.time(), item_id, worker_id)
+            )
+
+    def counts(self, content_type=None):
+        """Number of items per status"""
+        query = "SELECT status, COUNT(*) FROM work_items WHERE run_id = ?"
+        params = [self.run_id]
+        if content_type:
+            query += " AND content_type = ?"
+            params.append(content_type)
+        query += " GROUP BY status"
+
+        with self.connection() as conn:
+            return dict(conn.execute(query, params).fetchall())
+
+    def content_types(self):
+        """Content types queued in this run"""
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT content_type FROM work_items WHERE run_id = ? ORDER BY content_type",
+                (self.run_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def results(self, content_type):
+        """Finished result dicts for a content type, in input order"""
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT result FROM work_items WHERE run_id = ? AND content_type = ? AND status = 'done' "
+                "ORDER BY position",
+                (self.run_id, content_type)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class _Transaction:
+    """Wraps a connection in BEGIN IMMEDIATE ... COMMIT so claims are atomic across processes"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
+
+
+class Heartbeat:
+    """Background thread that keeps a worker's leases alive"""
+
+    def __init__(self, work_queue, worker_id, interval=None):
+        self.work_queue = work_queue
+        self.worker_id = worker_id
+        self.interval = interval or max(1.0, work_queue.lease_seconds / 3)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.work_queue.heartbeat(self.worker_id)
+            except sqlite3.Error as e:
+                print(f"Heartbeat failed: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        return False
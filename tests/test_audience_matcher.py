@@ -0,0 +1,61 @@
+"""
+Tests for the word-level audience matcher
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.audience_matcher import AudienceMatcher, taxonomy_from_terms
+
+TAXONOMY = {
+    'Agents': ['agent', 'agents', 'contact center agent', 'contact center agents'],
+    'Contact Center Managers': ['contact center manager', 'contact center managers'],
+    'Administrators': ['admin', 'administrator', 'administrators'],
+    'IT Professionals': ['it professional', 'it professionals', 'IT'],
+    'Supervisors': ['supervisor', 'supervisors'],
+}
+
+
+class AudienceMatcherTest(unittest.TestCase):
+    """Matching semantics of AudienceMatcher"""
+
+    def setUp(self):
+        self.matcher = AudienceMatcher(TAXONOMY)
+
+    def test_longest_term_wins_over_its_suffix(self):
+        self.assertEqual(self.matcher.matches("For contact center agents"), [(1, 4, 'Agents')])
+
+    def test_leftmost_match_wins_on_overlap(self):
+        matcher = AudienceMatcher({'Centers': ['contact center'], 'Managers': ['center managers']})
+        self.assertEqual(matcher.matches("contact center managers"), [(0, 2, 'Centers')])
+        self.assertEqual(self.matcher.matches("contact center managers and agents"),
+                         [(0, 3, 'Contact Center Managers'), (4, 5, 'Agents')])
+
+    def test_matches_whole_words_only(self):
+        self.assertEqual(self.matcher.find("administration and supervisory staff"), [])
+        self.assertEqual(self.matcher.find("admins"), [])
+        self.assertEqual(self.matcher.find("admin, supervisors"), ['Administrators', 'Supervisors'])
+
+    def test_lower_case_terms_ignore_case(self):
+        self.assertEqual(self.matcher.find("SUPERVISORS and Agents"), ['Agents', 'Supervisors'])
+
+    def test_capitalized_terms_are_case_sensitive(self):
+        self.assertEqual(self.matcher.find("Learn how it routes calls"), [])
+        self.assertEqual(self.matcher.find("Designed for IT teams"), ['IT Professionals'])
+        self.assertEqual(self.matcher.find("for it professionals"), ['IT Professionals'])
+
+    def test_find_returns_taxonomy_order_without_duplicates(self):
+        self.assertEqual(self.matcher.find("supervisors, agents, agent, admin"),
+                         ['Agents', 'Administrators', 'Supervisors'])
+
+    def test_taxonomy_from_terms(self):
+        self.assertEqual(taxonomy_from_terms({'agent': 'Agents', 'agents': 'Agents', 'admin': 'Administrators'}),
+                         {'Agents': ['agent', 'agents'], 'Administrators': ['admin']})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Tests for the JSONL checkpoint and resuming from it
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.checkpoint import CheckpointLog, CheckpointResults, load_checkpoint, read_checkpoint
+from utils.sharded_runner import ShardTail, leftover_shard_records
+
+
+def record(name, status='ok'):
+    return {'url': f'https://example.com/{name}', 'title': name, 'extraction_status': status}
+
+
+def write_lines(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+class CheckpointLogTest(unittest.TestCase):
+    """Appending to a checkpoint and reading it back"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'checkpoints', 'e-learning.jsonl')
+
+    def test_append_and_read(self):
+        with CheckpointLog(self.path) as log:
+            log.append(record('a'))
+            log.append(record('b'))
+        self.assertEqual([r['title'] for r in read_checkpoint(self.path)], ['a', 'b'])
+
+    def test_drop_torn_tail(self):
+        os.makedirs(os.path.dirname(self.path))
+        write_lines(self.path, json.dumps(record('a')) + '\n{"url": "https://exa')
+
+        with CheckpointLog(self.path) as log:
+            log.append(record('b'))
+        self.assertEqual([r['title'] for r in read_checkpoint(self.path)], ['a', 'b'])
+
+    def test_truncate_starts_over(self):
+        with CheckpointLog(self.path) as log:
+            log.append(record('a'))
+        log = CheckpointLog(self.path).open(truncate=True)
+        log.close()
+        self.assertEqual(list(read_checkpoint(self.path)), [])
+
+    def test_read_skips_a_torn_line(self):
+        os.makedirs(os.path.dirname(self.path))
+        write_lines(self.path, json.dumps(record('a')) + '\n{"url": "https://exa')
+        self.assertEqual([r['title'] for r in read_checkpoint(self.path)], ['a'])
+
+    def test_missing_checkpoint_is_empty(self):
+        self.assertEqual(list(read_checkpoint(self.path)), [])
+        self.assertEqual(len(CheckpointResults(self.path, [])), 0)
+
+    def test_latest_record_per_url_wins(self):
+        with CheckpointLog(self.path) as log:
+            log.append(record('a', 'error'))
+            log.append(record('b'))
+            log.append(record('a'))
+        self.assertEqual(load_checkpoint(self.path)['https://example.com/a']['extraction_status'], 'ok')
+
+    def test_results_follow_the_course_list(self):
+        with CheckpointLog(self.path) as log:
+            for name in ('c', 'a', 'extra', 'b'):
+                log.append(record(name))
+            log.append(record('a', 'error'))
+
+        urls = [f'https://example.com/{name}' for name in ('a', 'b', 'c', 'missing')]
+        results = CheckpointResults(self.path, urls, factory=lambda r: (r['title'], r['extraction_status']))
+        self.assertEqual(len(results), 4)
+        self.assertEqual(list(results), [('a', 'error'), ('b', 'ok'), ('c', 'ok'), ('extra', 'ok')])
+        # Iterating again reads the file again
+        self.assertEqual(len(list(results)), 4)
+
+
+class ShardFileTest(unittest.TestCase):
+    """Reading shard result files while they are written and after a crash"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_tail_returns_only_complete_new_lines(self):
+        path = os.path.join(self.tmp.name, 'e-learning_shard_0.jsonl')
+        tail = ShardTail(path)
+        self.assertEqual(tail.read_new(), [])
+
+        write_lines(path, json.dumps(dict(record('a'), index=0)) + '\n{"index": 1, "url"')
+        self.assertEqual([r['index'] for r in tail.read_new()], [0])
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(': "https://example.com/b"}\n')
+        self.assertEqual(tail.read_new(), [{'index': 1, 'url': 'https://example.com/b'}])
+        self.assertEqual(tail.read_new(), [])
+
+    def test_leftover_records_skip_dead_letters_and_other_types(self):
+        write_lines(os.path.join(self.tmp.name, 'e-learning_shard_0.jsonl'),
+                    json.dumps(dict(record('a'), index=0)) + '\n'
+                    + json.dumps({'index': 2, 'dead_letter': 'timeout'}) + '\n')
+        write_lines(os.path.join(self.tmp.name, 'e-learning_shard_1.jsonl'),
+                    json.dumps(dict(record('b'), index=1)) + '\n{"index": 3')
+        write_lines(os.path.join(self.tmp.name, 'webinars_shard_0.jsonl'),
+                    json.dumps(dict(record('w'), index=0)) + '\n')
+
+        self.assertEqual([r['title'] for r in leftover_shard_records(self.tmp.name, 'e-learning')], ['a', 'b'])
+        self.assertEqual(list(leftover_shard_records(os.path.join(self.tmp.name, 'none'), 'e-learning')), [])
+
+
+class ResumeTest(unittest.TestCase):
+    """Which saved results a resumed run skips"""
+
+    def setUp(self):
+        from universal_genesys_extractor import UniversalGenesysExtractor
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.shard_dir = os.path.join(self.tmp.name, 'shards')
+        self.json_file = os.path.join(self.tmp.name, 'e-learning.json')
+        config = {
+            'global_settings': {
+                'checkpoint': {'dir': os.path.join(self.tmp.name, 'checkpoints')},
+                'sharding': {'shard_dir': self.shard_dir}
+            },
+            'course_types': {
+                'e-learning': {'output_files': {'json': self.json_file}}
+            }
+        }
+        config_file = os.path.join(self.tmp.name, 'config.json')
+        write_lines(config_file, json.dumps(config))
+        self.extractor = UniversalGenesysExtractor(config_file)
+
+    def test_only_ok_records_are_finished(self):
+        with CheckpointLog(self.extractor.checkpoint_path('e-learning')) as log:
+            log.append(record('a'))
+            log.append(record('b', 'blocked'))
+            log.append(record('c', 'ok'))
+            log.append(record('c', 'error'))
+
+        self.assertEqual(list(self.extractor.load_finished_results('e-learning')), ['https://example.com/a'])
+
+    def test_old_outputs_without_status_need_content(self):
+        items = [{'url': 'https://example.com/a', 'description': 'Routing basics'},
+                 {'url': 'https://example.com/b', 'description': '', 'target_audience': []}]
+        write_lines(self.json_file, json.dumps({'items': items}))
+
+        self.assertEqual(list(self.extractor.load_finished_results('e-learning')), ['https://example.com/a'])
+
+    def test_leftover_shard_results_are_filtered(self):
+        os.makedirs(self.shard_dir)
+        write_lines(os.path.join(self.shard_dir, 'e-learning_shard_0.jsonl'),
+                    json.dumps(dict(record('a'), index=0)) + '\n'
+                    + json.dumps(dict(record('b', 'error'), index=1)) + '\n')
+
+        self.assertEqual([r['title'] for r in self.extractor.leftover_shard_results('e-learning')], ['a'])
+
+
+if __name__ == "__main__":
+    unittest.main()
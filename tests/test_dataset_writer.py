@@ -0,0 +1,115 @@
+"""
+Tests for the streaming dataset writers
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.dataset_writer import CSV_HEADER, ITEM_FIELDS, CombinedDatasetWriter, DatasetWriter, item_record
+
+DATASET_INFO = {'name': 'Genesys Learning Content', 'version': '1.0', 'creation_date': '2026-01-01T00:00:00'}
+
+
+def item(name, content_type='e-learning', description='', target_audience=None):
+    return item_record({
+        'title': name,
+        'url': f'https://example.com/{name}',
+        'content_type': content_type,
+        'description': description,
+        'course_outline': ['Intro', 'Routing'],
+        'target_audience': target_audience or [],
+        'duration_minutes': 30,
+    })
+
+
+class DatasetWriterTest(unittest.TestCase):
+    """JSON and CSV outputs of the streaming writers"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.json_path = os.path.join(self.tmp.name, 'all.json')
+        self.csv_path = os.path.join(self.tmp.name, 'all.csv')
+
+    def read_json(self):
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read_csv(self):
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+
+    def test_empty_combined_dataset_is_valid_json(self):
+        writer = CombinedDatasetWriter(self.json_path, self.csv_path)
+        summary = writer.close(DATASET_INFO)
+
+        data = self.read_json()
+        self.assertEqual(data, dict(summary, items=[]))
+        self.assertEqual(data['dataset_info']['total_items'], 0)
+        self.assertEqual(data['statistics'], {'by_content_type': {}, 'with_target_audience': 0,
+                                              'with_descriptions': 0})
+        self.assertEqual(self.read_csv(), [CSV_HEADER])
+
+    def test_combined_dataset_items_and_statistics(self):
+        items = [
+            item('a', description='Routing basics', target_audience=['Agents']),
+            item('b', content_type='webinars', description='Ünïcode "quotes"'),
+            item('c'),
+        ]
+        writer = CombinedDatasetWriter(self.json_path, self.csv_path)
+        for entry in items:
+            writer.write(entry)
+        writer.close(DATASET_INFO)
+
+        data = self.read_json()
+        self.assertEqual(list(data), ['items', 'dataset_info', 'statistics'])
+        self.assertEqual(data['items'], items)
+        self.assertEqual(list(data['items'][0]), ITEM_FIELDS)
+        self.assertEqual(data['dataset_info'], dict(DATASET_INFO, total_items=3,
+                                                    content_types=['e-learning', 'webinars']))
+        self.assertEqual(data['statistics'], {'by_content_type': {'e-learning': 2, 'webinars': 1},
+                                              'with_target_audience': 1, 'with_descriptions': 2})
+        self.assertEqual(writer.successful, 2)
+
+    def test_csv_rows_join_lists(self):
+        writer = DatasetWriter(self.json_path, self.csv_path)
+        writer.write(item('a', target_audience=['Agents', 'Supervisors']))
+        writer.write(dict(item('b'), duration_minutes=None, course_outline=None))
+        writer.close({'extraction_info': {}})
+
+        rows = self.read_csv()
+        self.assertEqual(rows[0], CSV_HEADER)
+        self.assertEqual(rows[1][CSV_HEADER.index('course_outline')], 'Intro | Routing')
+        self.assertEqual(rows[1][CSV_HEADER.index('target_audience')], 'Agents | Supervisors')
+        self.assertEqual(rows[1][CSV_HEADER.index('duration_minutes')], '30')
+        self.assertEqual(rows[2][CSV_HEADER.index('duration_minutes')], '')
+        self.assertEqual(rows[2][CSV_HEADER.index('course_outline')], '')
+
+    def test_files_appear_only_when_closed(self):
+        writer = DatasetWriter(self.json_path, self.csv_path)
+        writer.write(item('a'))
+        self.assertFalse(os.path.exists(self.json_path))
+        writer.close({'extraction_info': {}})
+        self.assertEqual(self.read_json()['extraction_info'], {})
+
+    def test_abort_keeps_the_previous_dataset(self):
+        DatasetWriter(self.json_path, self.csv_path).close({'extraction_info': {'run': 1}})
+
+        writer = DatasetWriter(self.json_path, self.csv_path)
+        writer.write(item('a'))
+        writer.abort()
+
+        self.assertEqual(self.read_json(), {'items': [], 'extraction_info': {'run': 1}})
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['all.csv', 'all.json'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for course duration parsing
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.duration import format_duration, parse_duration
+
+
+class ParseDurationTest(unittest.TestCase):
+    """parse_duration returns (display string, minutes)"""
+
+    def test_hours_and_minutes_are_summed(self):
+        self.assertEqual(parse_duration("Duration: 1 hour 25 minutes"), ("1 hr 25 mins", 85))
+        self.assertEqual(parse_duration("2 hrs and 15 mins"), ("2 hrs 15 mins", 135))
+        self.assertEqual(parse_duration("1 hour, 5 minutes"), ("1 hr 5 mins", 65))
+
+    def test_compact_units(self):
+        self.assertEqual(parse_duration("1h 30m"), ("1 hr 30 mins", 90))
+        self.assertEqual(parse_duration("45m"), ("", None))
+        self.assertEqual(parse_duration("2h"), ("2 hrs", 120))
+
+    def test_lone_m_is_not_minutes(self):
+        self.assertEqual(parse_duration("Trusted by 4.5m users. Duration 30 minutes"), ("30 mins", 30))
+
+    def test_decimal_hours(self):
+        self.assertEqual(parse_duration("1.5 hours"), ("1 hr 30 mins", 90))
+        self.assertEqual(parse_duration("0.25 hrs"), ("15 mins", 15))
+
+    def test_only_the_first_duration_is_read(self):
+        self.assertEqual(parse_duration("30 minutes video, then 2 hours of labs"), ("30 mins", 30))
+        self.assertEqual(parse_duration("1 hour 20 minutes 3 hours"), ("1 hr 20 mins", 80))
+
+    def test_minutes_before_hours_do_not_combine(self):
+        self.assertEqual(parse_duration("10 minutes 1 hour"), ("10 mins", 10))
+
+    def test_bare_unit_applies_to_bare_numbers_only(self):
+        self.assertEqual(parse_duration("85", bare_unit='minutes'), ("1 hr 25 mins", 85))
+        self.assertEqual(parse_duration("1.5", bare_unit='hours'), ("1 hr 30 mins", 90))
+        self.assertEqual(parse_duration("85"), ("", None))
+        self.assertEqual(parse_duration("2 hours", bare_unit='minutes'), ("2 hrs", 120))
+
+    def test_no_duration(self):
+        self.assertEqual(parse_duration(""), ("", None))
+        self.assertEqual(parse_duration(None), ("", None))
+        self.assertEqual(parse_duration("Self-paced course"), ("", None))
+
+
+class FormatDurationTest(unittest.TestCase):
+    """format_duration builds the display string"""
+
+    def test_formats(self):
+        self.assertEqual(format_duration(0), "0 mins")
+        self.assertEqual(format_duration(1), "1 min")
+        self.assertEqual(format_duration(60), "1 hr")
+        self.assertEqual(format_duration(121), "2 hrs 1 min")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for course page segmentation
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.page_sections import segment_page
+
+
+class SegmentPageTest(unittest.TestCase):
+    """Heading boundaries and section priority of segment_page"""
+
+    def test_section_runs_to_the_next_heading(self):
+        sections = segment_page("Overview: Routing basics. Target Audience: Supervisors and agents. Duration: 1 hour")
+        self.assertEqual(sections.first('description'), "Routing basics.")
+        self.assertEqual(sections.first('target_audience'), "Supervisors and agents.")
+        self.assertEqual(sections.first('duration'), "1 hour")
+
+    def test_heading_joined_to_its_section(self):
+        sections = segment_page("Target AudienceAdministrators and IT staff PrerequisitesNone")
+        self.assertEqual(sections.first('target_audience'), "Administrators and IT staff")
+        self.assertEqual(sections.first('prerequisites'), "None")
+
+    def test_heading_must_end_at_a_word_end(self):
+        sections = segment_page("Overviews of the platform. Outlined below: nothing")
+        self.assertEqual(sections.headings, [])
+
+    def test_heading_must_start_at_a_word_start(self):
+        self.assertEqual(segment_page("CourseOverview text").headings, [])
+
+    def test_generic_headings_are_case_sensitive(self):
+        sections = segment_page("This course gives an overview of the outline. Agenda: Queues")
+        self.assertEqual([label for label, _, _, _ in sections.headings], ['outline'])
+        self.assertEqual(sections.first('outline'), "Queues")
+
+    def test_multi_word_headings_ignore_case(self):
+        sections = segment_page("WHO SHOULD ATTEND: supervisors")
+        self.assertEqual(sections.first('target_audience'), "supervisors")
+
+    def test_higher_priority_heading_first(self):
+        sections = segment_page("Designed for: anyone. Objectives: learn. Target Audience: Agents")
+        self.assertEqual(sections.sections('target_audience'), ["Agents", "anyone."])
+        self.assertEqual(sections.first('target_audience'), "Agents")
+
+    def test_same_heading_in_page_order(self):
+        sections = segment_page("Suitable for: first. Objectives: x. Suitable for: second")
+        self.assertEqual(sections.sections('target_audience'), ["first.", "second"])
+
+    def test_max_length_bounds_the_section(self):
+        sections = segment_page("Target Audience: Agents and supervisors")
+        self.assertEqual(sections.sections('target_audience', max_length=8), ["Agents"])
+
+    def test_missing_section_returns_default(self):
+        sections = segment_page("No headings here")
+        self.assertEqual(sections.first('outline'), '')
+        self.assertIsNone(sections.first('outline', default=None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for delayed retries and dead-lettering
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.retry_scheduler import RetryScheduler
+
+ITEM = {'title': 'Architect Fundamentals', 'url': 'https://example.com/architect-fundamentals'}
+
+
+class BackoffTest(unittest.TestCase):
+    """backoff doubles per attempt, is capped, and jitters within the upper half"""
+
+    def test_exponential_with_equal_jitter(self):
+        scheduler = RetryScheduler(base_delay=2.0, max_delay=60.0)
+        with mock.patch('utils.retry_scheduler.random.uniform', side_effect=lambda low, high: high):
+            self.assertEqual([scheduler.backoff(attempt) for attempt in (1, 2, 3)], [2.0, 4.0, 8.0])
+        with mock.patch('utils.retry_scheduler.random.uniform', side_effect=lambda low, high: low):
+            self.assertEqual([scheduler.backoff(attempt) for attempt in (1, 2, 3)], [1.0, 2.0, 4.0])
+
+    def test_capped_at_max_delay(self):
+        scheduler = RetryScheduler(base_delay=2.0, max_delay=10.0)
+        for _ in range(20):
+            self.assertTrue(5.0 <= scheduler.backoff(10) <= 10.0)
+
+
+class ScheduleTest(unittest.TestCase):
+    """Items wait out their backoff and are dead-lettered once retries run out"""
+
+    def test_item_is_ready_after_its_delay(self):
+        scheduler = RetryScheduler(max_retries=2, base_delay=0.0)
+        self.assertTrue(scheduler.schedule(0, ITEM, 'timeout'))
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(scheduler.pop_ready(), [(0, ITEM)])
+        self.assertEqual(len(scheduler), 0)
+        self.assertIsNone(scheduler.next_delay())
+
+    def test_item_is_not_ready_before_its_delay(self):
+        scheduler = RetryScheduler(max_retries=2, base_delay=30.0, max_delay=30.0)
+        scheduler.schedule(0, ITEM)
+        self.assertEqual(scheduler.pop_ready(), [])
+        self.assertGreater(scheduler.next_delay(), 14.0)
+        self.assertLessEqual(scheduler.next_delay(), 30.0)
+
+    def test_dead_lettered_after_max_retries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dead_letter_file = os.path.join(tmp, 'letters', 'dead.jsonl')
+            scheduler = RetryScheduler(max_retries=2, base_delay=0.0, dead_letter_file=dead_letter_file)
+
+            self.assertTrue(scheduler.schedule(3, ITEM, 'error'))
+            self.assertTrue(scheduler.schedule(3, ITEM, 'error'))
+            self.assertFalse(scheduler.schedule(3, ITEM, 'blocked'))
+            self.assertEqual(scheduler.attempts[3], 2)
+            self.assertEqual(scheduler.dead_letters, 1)
+
+            with open(dead_letter_file, 'r', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]['url'], ITEM['url'])
+            self.assertEqual(records[0]['attempts'], 3)
+            self.assertEqual(records[0]['reason'], 'blocked')
+
+    def test_zero_retries_dead_letters_immediately(self):
+        scheduler = RetryScheduler(max_retries=0)
+        self.assertFalse(scheduler.schedule(0, ITEM))
+        self.assertEqual(len(scheduler), 0)
+        self.assertEqual(scheduler.dead_letters, 1)
+
+    def test_ready_items_come_out_in_due_order(self):
+        scheduler = RetryScheduler(max_retries=3, base_delay=0.0)
+        scheduler.schedule(0, ITEM)
+        scheduler.schedule(1, ITEM)
+        scheduler.schedule(1, ITEM)
+        self.assertEqual([index for index, _ in scheduler.pop_ready()], [0, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the SQLite lease-based work queue
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.work_queue import SqliteWorkQueue
+
+COURSES = [
+    {'title': 'Architect Fundamentals', 'url': 'https://example.com/architect'},
+    {'title': 'Routing Basics', 'url': 'https://example.com/routing'},
+]
+
+
+class WorkQueueTest(unittest.TestCase):
+    """Leases, expiry, reclaiming and failing of SqliteWorkQueue items"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = SqliteWorkQueue(os.path.join(self.tmp.name, 'queue.db'), run_id='test', lease_seconds=60)
+        self.queue.enqueue('e-learning', COURSES)
+        self.now = 1000.0
+        patcher = mock.patch('utils.work_queue.time.time', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.queue._connect().close()
+        self.tmp.cleanup()
+
+    def test_enqueue_skips_queued_urls(self):
+        self.assertEqual(self.queue.enqueue('e-learning', COURSES), 0)
+        self.assertEqual(self.queue.counts(), {'pending': 2})
+
+    def test_claim_leases_in_input_order(self):
+        items = self.queue.claim('w1', 'e-learning', limit=1)
+        self.assertEqual([item['url'] for item in items], [COURSES[0]['url']])
+        self.assertEqual(items[0]['attempts'], 1)
+        self.assertEqual(self.queue.counts(), {'leased': 1, 'pending': 1})
+
+    def test_live_lease_is_not_reclaimed(self):
+        self.queue.claim('w1', limit=2)
+        self.now += 59
+        self.assertEqual(self.queue.claim('w2', limit=2), [])
+
+    def test_heartbeat_extends_the_lease(self):
+        self.queue.claim('w1', limit=2)
+        self.now += 50
+        self.queue.heartbeat('w1')
+        self.now += 50
+        self.assertEqual(self.queue.claim('w2', limit=2), [])
+
+    def test_expired_lease_is_reclaimed(self):
+        first = self.queue.claim('w1', limit=1)[0]
+        self.now += 61
+        second = self.queue.claim('w2', limit=1)[0]
+        self.assertEqual(second['id'], first['id'])
+        self.assertEqual(second['attempts'], 2)
+
+        # The first worker lost its lease, so its late result is dropped
+        self.assertFalse(self.queue.complete(first['id'], 'w1', {'url': first['url']}))
+        self.assertTrue(self.queue.complete(second['id'], 'w2', {'url': second['url']}))
+        self.assertEqual(self.queue.results('e-learning'), [{'url': first['url']}])
+
+    def test_expired_lease_fails_after_max_attempts(self):
+        for _ in range(2):
+            self.assertEqual(len(self.queue.claim('w1', limit=1, max_attempts=2)), 1)
+            self.now += 61
+
+        self.assertEqual([item['url'] for item in self.queue.claim('w2', limit=1, max_attempts=2)],
+                         [COURSES[1]['url']])
+        self.assertEqual(self.queue.counts(), {'failed': 1, 'leased': 1})
+
+    def test_fail_releases_until_max_attempts(self):
+        item = self.queue.claim('w1', limit=1)[0]
+        self.queue.fail(item['id'], 'w1', 'timeout', max_attempts=2)
+        self.assertEqual(self.queue.counts(), {'pending': 2})
+
+        item = self.queue.claim('w1', limit=1)[0]
+        self.assertEqual(item['attempts'], 2)
+        self.queue.fail(item['id'], 'w1', 'timeout', max_attempts=2)
+        self.assertEqual(self.queue.counts(), {'failed': 1, 'pending': 1})
+
+
+if __name__ == "__main__":
+    unittest.main()